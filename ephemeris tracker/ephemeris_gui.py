@@ -6,6 +6,7 @@ Uses Skyfield to fetch live ephemeris data instead of pre-downloaded files.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
 from datetime import datetime, timedelta
 import pytz
 from pathlib import Path
@@ -39,7 +40,12 @@ class EphemerisTrackerGUI:
         self.selected_objects = []
         self.is_generating = False
         
+        # Worker threads drop log messages here; the main thread drains
+        # the queue on a timer and inserts each batch in one call
+        self.log_queue = queue.Queue()
+        
         self.setup_ui()
+        self.root.after(100, self._drain_log_queue)
     
     def setup_ui(self):
         """Setup the GUI components."""
@@ -211,13 +217,25 @@ class EphemerisTrackerGUI:
     
     def update_log(self, message):
         """Thread-safe log update."""
-        self.root.after(0, lambda: self._update_log_main(message))
+        self.log_queue.put(message)
     
-    def _update_log_main(self, message):
-        """Main thread log update."""
-        self.log_text.insert(tk.END, message)
-        self.log_text.see(tk.END)
-        self.root.update()
+    def _drain_log_queue(self):
+        """Main thread: flush queued log messages as one insert."""
+        batch = []
+        try:
+            while True:
+                batch.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            self.log_text.insert(tk.END, "".join(batch))
+            self.log_text.see(tk.END)
+            # update_idletasks only flushes redraws; a full update() here
+            # would re-enter the event loop from inside a callback
+            self.root.update_idletasks()
+        
+        self.root.after(100, self._drain_log_queue)
 
 
 def main():
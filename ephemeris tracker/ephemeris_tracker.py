@@ -5,9 +5,13 @@ Supports hundreds of celestial objects and can generate tracking logs.
 
 import skyfield.api as skyapi
 from skyfield.data import hipparcos, mpc
+from skyfield.toposlib import wgs84
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pytz
 import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Download and cache ephemeris data
@@ -15,6 +19,24 @@ eph = skyapi.load('de421.bsp')  # Planetary ephemeris (very accurate, covers 190
 earth = eph['earth']
 sun = eph['sun']
 
+
+@lru_cache(maxsize=1)
+def _hipparcos_df():
+    """Load the Hipparcos catalog once; ~118k rows of CSV per parse."""
+    return skyapi.load_dataframe(hipparcos.URL)
+
+
+@lru_cache(maxsize=1)
+def _timescale():
+    """Build the Skyfield timescale once; it has no per-call state."""
+    return skyapi.load.timescale()
+
+
+@lru_cache(maxsize=8)
+def _observer_location(lat, lon, alt):
+    """Cache the topocentric observer; the ground station rarely moves."""
+    return earth + wgs84.latlon(lat, lon, alt)
+
 # Available object types
 BUILTIN_OBJECTS = {
     'sun': ('sun', None),
@@ -37,7 +59,7 @@ def get_available_objects():
     
     # Load bright stars from Hipparcos catalog
     try:
-        df = skyapi.load_dataframe(hipparcos.URL)
+        df = _hipparcos_df()
         star_count = len(df)
         objects['stars'] = ('hipparcos', df)
         objects['_star_count'] = star_count
@@ -79,6 +101,22 @@ def get_object_list_for_gui():
     
     return gui_list
 
+@lru_cache(maxsize=64)
+def _resolve_target(target_name):
+    """Resolve a target name to a Skyfield body, or None if unknown.
+
+    Cached so repeated queries for the same planet or star reuse the
+    ephemeris segment / Star object instead of rebuilding it per call.
+    """
+    key = target_name.lower()
+    if key in BUILTIN_OBJECTS:
+        return eph[key]
+    if target_name.startswith('hipparcos_'):
+        hip_num = int(target_name.split('_')[1])
+        df = _hipparcos_df()
+        return skyapi.Star.from_dataframe(df.iloc[[hip_num]])
+    return None
+
 def get_position(observer_lat, observer_lon, observer_alt, target_name, observation_time_utc):
     """
     Calculate azimuth and altitude for a target object from observer location.
@@ -95,50 +133,27 @@ def get_position(observer_lat, observer_lon, observer_alt, target_name, observat
         tuple: (azimuth_degrees, altitude_degrees) or (None, None) if error
     """
     try:
-        import math
-        from skyfield.toposlib import wgs84
-        
-        ts = skyapi.load.timescale()
+        ts = _timescale()
         t = ts.from_datetime(observation_time_utc)
         
         # Create observer location (altitude in meters)
-        observer_location = earth + wgs84.latlon(observer_lat, observer_lon, observer_alt)
+        observer_location = _observer_location(observer_lat, observer_lon, observer_alt)
         
         # Get target astrometric position
-        if target_name.lower() in BUILTIN_OBJECTS:
-            target = eph[target_name.lower()]
-        elif target_name.startswith('hipparcos_'):
-            # Star from Hipparcos catalog
-            hip_num = int(target_name.split('_')[1])
-            df = skyapi.load_dataframe(hipparcos.URL)
-            star_data = df.loc[hip_num]
-            target = skyapi.Star.from_dataframe(df.iloc[[hip_num]])
-        else:
+        target = _resolve_target(target_name)
+        if target is None:
             return None, None
         
-        # Get observer's position at this time
-        observer_at_time = observer_location.at(t)
-        
-        # Calculate position of target relative to observer
-        astrometric = observer_at_time.observe(target)
-        apparent = astrometric.apparent()
-        
-        # Use Skyfield's built-in coordinate frame transformation to get alt/az
-        # This is more accurate than manually calculating from RA/Dec
-        from skyfield.toposlib import wgs84
-        
-        # Get altitude and azimuth directly in topocentric horizontal frame
-        apparent_topocentric = observer_location.at(t).observe(target).apparent()
-        alt, az, distance = apparent_topocentric.apparent_latitudinal()
-        
-        altitude = alt.degrees
-        azimuth = az.degrees
-        
-        return azimuth, altitude
+        # Observe once and convert to the topocentric horizontal frame;
+        # altaz() is the correct Skyfield API for alt/az (the previous
+        # apparent_latitudinal() call returned ecliptic-frame angles)
+        apparent = observer_location.at(t).observe(target).apparent()
+        alt, az, distance = apparent.altaz()
+
+        return az.degrees, alt.degrees
     
     except Exception as e:
         print(f"Error calculating position for {target_name}: {e}")
-        import traceback
         traceback.print_exc()
         return None, None
 
@@ -164,15 +179,43 @@ def generate_tracking_log(observer_lat, observer_lon, observer_alt, target_names
         output_file = f'tracking_log_{timestamp}.txt'
     
     start_time = datetime.now(pytz.UTC)
-    end_time = start_time + timedelta(hours=duration_hours)
-    current_time = start_time
+    n_steps = int(duration_hours * 3600 // time_step_seconds) + 1
+    step = timedelta(seconds=time_step_seconds)
+    times = [start_time + i * step for i in range(n_steps)]
+    
+    # One array-valued Time covering every step; Skyfield vectorizes
+    # observe() over it, so each target costs one NumPy pass instead of
+    # one Python call per timestep
+    t = _timescale().from_datetimes(times)
+    observer_at_times = _observer_location(observer_lat, observer_lon,
+                                           observer_alt).at(t)
+    
+    def _one_target(target_name):
+        target = _resolve_target(target_name)
+        if target is None:
+            print(f"Warning: Unknown target '{target_name}', skipping")
+            return target_name, None
+        apparent = observer_at_times.observe(target).apparent()
+        alt, az, _ = apparent.altaz()
+        return target_name, (az.degrees, alt.degrees)
+
+    # observe() spends its time in NumPy code that releases the GIL, so
+    # threads scale across targets; ex.map keeps the original order
+    target_angles = {}
+    with ThreadPoolExecutor(
+            max_workers=min(len(target_names), os.cpu_count() or 1)) as ex:
+        for target_name, angles in ex.map(_one_target, target_names):
+            if angles is not None:
+                target_angles[target_name] = angles
     
     # Create log directory if it doesn't exist
     log_dir = Path('tracking_logs')
     log_dir.mkdir(exist_ok=True)
     output_path = log_dir / output_file
     
-    with open(output_path, 'w') as f:
+    # Rows are joined and flushed in batches; one buffered write per few
+    # thousand rows instead of a locked io-stack call per row
+    with open(output_path, 'w', buffering=1 << 20) as f:
         f.write(f"Tracking Log - Generated {start_time.isoformat()}\n")
         f.write(f"Observer: Lat={observer_lat}, Lon={observer_lon}, Alt={observer_alt}m\n")
         f.write(f"Duration: {duration_hours} hours, Time Step: {time_step_seconds}s\n")
@@ -181,19 +224,25 @@ def generate_tracking_log(observer_lat, observer_lon, observer_alt, target_names
         f.write("Unix_Time, DateTime_UTC, Target, Azimuth, Altitude\n")
         
         entries_count = 0
-        while current_time <= end_time:
+        rows = []
+        for i, current_time in enumerate(times):
             unix_time = int(current_time.timestamp())
             datetime_str = current_time.strftime('%Y-%m-%d %H:%M:%S')
             
             for target_name in target_names:
-                az, alt = get_position(observer_lat, observer_lon, observer_alt, 
-                                      target_name, current_time)
-                
-                if az is not None and alt is not None:
-                    f.write(f"{unix_time}, {datetime_str}, {target_name}, {az:.4f}, {alt:.4f}\n")
-                    entries_count += 1
+                if target_name not in target_angles:
+                    continue
+                az, alt = target_angles[target_name]
+                rows.append(f"{unix_time}, {datetime_str}, {target_name}, "
+                            f"{az[i]:.4f}, {alt[i]:.4f}\n")
+                entries_count += 1
             
-            current_time += timedelta(seconds=time_step_seconds)
+            if len(rows) >= 4096:
+                f.write("".join(rows))
+                rows.clear()
+        
+        if rows:
+            f.write("".join(rows))
     
     print(f"✓ Generated tracking log: {output_path}")
     print(f"  Total entries: {entries_count}")
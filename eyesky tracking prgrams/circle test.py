@@ -1,20 +1,32 @@
-import numpy as np
 import socket
+import sys
 import time
 
+from circle_sweep import sweep
+
 ESP32_IP = "192.168.1.56"
 ESP32_PORT = 10000
 
+# Per-command console echo; line-buffered print in the send path costs
+# real time on slow consoles, so it is off by default
+VERBOSE = False
+
+if VERBOSE:
+    # Block-buffer the echo stream; a line-buffered tty would pay a
+    # flush syscall per echoed command at the 40 Hz send rate
+    sys.stdout.reconfigure(line_buffering=False)
+
 sock = None
 connected = False
 
 def send_position(cmd):
     """
-    Sends a command to the ESP32. Manages connection and reconnection attempts.
+    Sends a command (bytes payload) to the ESP32. Manages connection and reconnection attempts.
     """
     global sock, connected # Declare intent to modify global variables
     
-    print(f"---> {cmd}")
+    if VERBOSE:
+        print("--->", cmd.decode('ascii'), end='')
     
     # Try to establish connection if not already connected
     if not connected:
@@ -27,6 +39,10 @@ def send_position(cmd):
             # Set a timeout for connect to prevent hanging indefinitely
             sock.settimeout(5) 
             sock.connect((ESP32_IP, ESP32_PORT))
+            # Small commands must go out immediately; without this Nagle
+            # batches them and the post-send sleep was the workaround
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
             connected = True
             print("Successfully connected to ESP32.")
             # Revert to blocking or set a specific send timeout if preferred
@@ -40,8 +56,7 @@ def send_position(cmd):
     # If connected, try to send the data
     if connected:
         try:
-            sock.sendall((cmd+"\n").encode())
-            time.sleep(0.05) # Keep the original delay
+            sock.sendall(cmd)
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
             print(f"Error sending data to ESP32: {e}. Connection lost, will attempt to reconnect next cycle.")
             if sock:
@@ -58,12 +73,4 @@ def send_position(cmd):
         print("Not connected to ESP32, skipping data send.")
 
 
-A=45
-for i in range(541):
-    ALT=A*np.cos(np.deg2rad(i*3))
-    AZ=45*np.sin(np.deg2rad(i*3))
-    print(f'AZ:{AZ:.5f} ALT:{ALT:.5f}')
-    cmd=f'AZ:{AZ:.5f} ALT:{ALT:.5f}'
-    time.sleep(0.5)
-    
-    send_position(cmd)
\ No newline at end of file
+sweep(send_position, n=541, alt_step_deg=3, az_step_deg=3, period_s=0.5)
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""Shared motion-sweep loop for the circle test scripts.
+
+The TCP and serial variants each carried their own copy of the sweep
+loop; this module holds the single precomputed-trig implementation and
+the wire format, parameterized on a send callable so each script only
+supplies its transport.
+"""
+
+import time
+import numpy as np
+
+# bytes % tuple formats straight to the wire payload in C, skipping the
+# per-send str build + UTF-8 encode
+CMD_FMT = b"AZ:%.5f ALT:%.5f\n"
+
+
+def sweep(send_fn, n=1081, alt_amp=45, alt_step_deg=0.5,
+          az_amp=45, az_step_deg=0.5, period_s=0.025):
+    """
+    Drive a full test sweep, calling send_fn(cmd_bytes) once per step.
+
+    The whole trajectory is precomputed with two vectorized trig passes
+    over in-place buffers, so the loop body is just formatting, the
+    send, and the cadence sleep.
+    """
+    steps = np.arange(n)
+
+    alt_rad = np.deg2rad(steps * alt_step_deg)
+    alts = np.cos(alt_rad, out=alt_rad)
+    alts *= alt_amp
+
+    az_rad = np.deg2rad(steps * az_step_deg)
+    azs = np.sin(az_rad, out=az_rad)
+    azs *= az_amp
+
+    # Format every command up front as well, so the timed loop does
+    # nothing but send and sleep
+    cmds = [CMD_FMT % (az, alt) for az, alt in zip(azs, alts)]
+    for cmd in cmds:
+        send_fn(cmd)
+        time.sleep(period_s)
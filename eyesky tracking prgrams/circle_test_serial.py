@@ -1,21 +1,33 @@
-import numpy as np
 import serial
+import sys
 import time
 
+from circle_sweep import sweep
+
 # Serial port configuration
 SERIAL_PORT = "COM5"  # Change this to your ESP32's COM port
 BAUD_RATE = 115200
 
+# Per-command console echo; line-buffered print in the send path costs
+# real time on slow consoles, so it is off by default
+VERBOSE = False
+
+if VERBOSE:
+    # Block-buffer the echo stream; a line-buffered tty would pay a
+    # flush syscall per echoed command at the 40 Hz send rate
+    sys.stdout.reconfigure(line_buffering=False)
+
 ser = None
 connected = False
 
 def send_position(cmd):
     """
-    Sends a command to the ESP32 via serial port. Manages connection and reconnection attempts.
+    Sends a command (bytes payload) to the ESP32 via serial port. Manages connection and reconnection attempts.
     """
     global ser, connected
     
-    print(f"---> {cmd}")
+    if VERBOSE:
+        print("--->", cmd.decode('ascii'), end='')
     
     # Try to establish connection if not already connected
     if not connected:
@@ -37,8 +49,10 @@ def send_position(cmd):
     # If connected, try to send the data
     if connected:
         try:
-            ser.write((cmd + "\n").encode())
-            time.sleep(0.05)  # Keep the original delay
+            ser.write(cmd)
+            # flush() blocks only until the driver buffer drains, unlike
+            # the previous fixed 50ms sleep
+            ser.flush()
         except (serial.SerialException, OSError) as e:
             print(f"Error sending data to ESP32: {e}. Connection lost, will attempt to reconnect next cycle.")
             if ser:
@@ -65,16 +79,8 @@ def cleanup():
 
 
 # Main tracking loop
-A = 45
 try:
-    for i in range(1081):
-        ALT = A * np.cos(np.deg2rad(i/2))
-        AZ = 45 * np.sin(np.deg2rad(i/2))
-        print(f'AZ:{AZ:.5f} ALT:{ALT:.5f}')
-        cmd = f'AZ:{AZ:.5f} ALT:{ALT:.5f}'
-        time.sleep(0.025)
-        
-        send_position(cmd)
+    sweep(send_position)
 except KeyboardInterrupt:
     print("\nTracking interrupted by user.")
 finally:
@@ -1,46 +1,35 @@
 #!/usr/bin/env python3
-import numpy as np
 import serial
 import time
-import os
 import glob
 import argparse
 import sys
 
+from circle_sweep import sweep
+from port_utils import find_serial_port, set_low_latency
+
 BAUD_RATE_DEFAULT = 115200
 
+# Per-command console echo (--verbose); line-buffered print in the send
+# path costs real time on slow consoles, so it is off by default
+VERBOSE = False
+
 ser = None
 connected = False
 
 
-def find_serial_port(preferred=None):
-    if preferred:
-        return preferred
-    env_port = os.environ.get("SERIAL_PORT")
-    if env_port:
-        return env_port
-
-    if os.name == 'nt':
-        return 'COM5'
-
-    patterns = ['/dev/serial/by-id/*', '/dev/ttyUSB*', '/dev/ttyACM*', '/dev/cu.*']
-    matches = []
-    for p in patterns:
-        matches.extend(glob.glob(p))
-    matches = sorted(matches)
-    return matches[0] if matches else None
-
-
 def send_position(cmd, port, baud):
-    """Send command over serial, handling reconnects."""
+    """Send a bytes command over serial, handling reconnects."""
     global ser, connected
-    print(f"---> {cmd}")
+    if VERBOSE:
+        print("--->", cmd.decode('ascii'), end='')
 
     if not connected:
         try:
             if ser:
                 ser.close()
             ser = serial.Serial(port, baud, timeout=5)
+            set_low_latency(ser)
             time.sleep(2)
             connected = True
             print(f"Connected to {port} at {baud} baud.")
@@ -61,8 +50,10 @@ def send_position(cmd, port, baud):
 
     if connected:
         try:
-            ser.write((cmd + "\n").encode())
-            time.sleep(0.05)
+            ser.write(cmd)
+            # flush() blocks only until the driver buffer drains, unlike
+            # the previous fixed 50ms sleep
+            ser.flush()
         except (serial.SerialException, OSError) as e:
             print(f"Error sending data: {e}. Will reconnect next loop.")
             if ser:
@@ -94,8 +85,16 @@ def main():
     parser.add_argument('--baud', type=int, default=BAUD_RATE_DEFAULT, help='Baud rate')
     parser.add_argument('--retry', action='store_true', help='Keep retrying until device appears')
     parser.add_argument('--simulate', action='store_true', help='Do not open serial; just print commands')
+    parser.add_argument('--verbose', action='store_true', help='Echo each command to the console')
     args = parser.parse_args()
 
+    global VERBOSE
+    VERBOSE = args.verbose or args.simulate
+    if VERBOSE:
+        # Block-buffer the echo stream; a line-buffered tty would pay a
+        # flush syscall per echoed command at the 40 Hz send rate
+        sys.stdout.reconfigure(line_buffering=False)
+
     port = find_serial_port(args.port)
     if not port and not args.retry and not args.simulate:
         print("No serial port found.")
@@ -121,18 +120,16 @@ def main():
     else:
         print(f"Using serial port: {port} at {args.baud} baud")
 
-    A = 45
+    if args.simulate:
+        def send_fn(cmd):
+            if VERBOSE:
+                print(cmd.decode('ascii'), end='')
+    else:
+        def send_fn(cmd):
+            send_position(cmd, port, args.baud)
+
     try:
-        for i in range(1081):
-            ALT = A * np.cos(np.deg2rad(i/12))
-            AZ = 90 * np.sin(np.deg2rad(3*i))
-            out = f'AZ:{AZ:.5f} ALT:{ALT:.5f}'
-            print(out)
-            if args.simulate:
-                time.sleep(0.025)
-                continue
-            send_position(out, port, args.baud)
-            time.sleep(0.025)
+        sweep(send_fn, alt_step_deg=1 / 12, az_amp=90, az_step_deg=3)
     except KeyboardInterrupt:
         print('\nInterrupted by user.')
     finally:
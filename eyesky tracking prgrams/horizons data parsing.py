@@ -1,8 +1,14 @@
 import numpy as np
 import socket
 import time
-import pytz
-from datetime import datetime, timezone, timedelta
+import calendar
+
+try:
+    import pandas as pd
+    _HAVE_PANDAS = True
+except ImportError:
+    # pandas is optional; parsing falls back to the per-line loop.
+    _HAVE_PANDAS = False
 ESP32_IP = "192.168.1.56"
 ESP32_PORT = 10000
 
@@ -11,11 +17,11 @@ connected = False
 
 def send_position(cmd):
     """
-    Sends a command to the ESP32. Manages connection and reconnection attempts.
+    Sends a byte command to the ESP32. Manages connection and reconnection attempts.
     """
     global sock, connected # Declare intent to modify global variables
     
-    print(f"---> {cmd}")
+    print("--->", cmd.decode('ascii'), end='')
     
     # Try to establish connection if not already connected
     if not connected:
@@ -28,10 +34,13 @@ def send_position(cmd):
             # Set a timeout for connect to prevent hanging indefinitely
             sock.settimeout(5) 
             sock.connect((ESP32_IP, ESP32_PORT))
+            # Nagle would hold each ~30-byte command waiting for an ACK;
+            # the commands must reach the servo immediately
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Back to blocking sends; the 5s timeout was only for connect
+            sock.settimeout(None)
             connected = True
             print("Successfully connected to ESP32.")
-            # Revert to blocking or set a specific send timeout if preferred
-            # sock.settimeout(None) # Can remove this if 5s timeout is acceptable for sends too
         except (ConnectionRefusedError, OSError) as e:
             print(f"Failed to connect to ESP32: {e}. Will retry later.")
             sock = None # Ensure sock is None if connection failed
@@ -41,8 +50,7 @@ def send_position(cmd):
     # If connected, try to send the data
     if connected:
         try:
-            sock.sendall((cmd+"\n").encode())
-            time.sleep(0.1) # Keep the original delay
+            sock.sendall(cmd)
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
             print(f"Error sending data to ESP32: {e}. Connection lost, will attempt to reconnect next cycle.")
             if sock:
@@ -57,58 +65,96 @@ def send_position(cmd):
             connected = False
     else:
         print("Not connected to ESP32, skipping data send.")
-with open('C:/Users/Owner/Downloads/horizons_results (14).txt', 'r') as file:
-    data = file.read()
+DATA_FILE = 'C:/Users/Owner/Downloads/horizons_results (14).txt'
 
-print("Data loaded from file.")
+# Horizons month abbreviations for the arithmetic timestamp path
+_MONTHS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+           'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
 
-def parse_ephemeris_tuples(data_string):
-    results = []
-    lines = data_string.split('\n')
-    in_data = False
-    
-     # Create UTC+10 timezone object
-    tz = pytz.FixedOffset(10 * 60) # 10 hours * 60 minutes
-    
-    
-    for line in lines:
-        line = line.strip()
-        
-        if line == '$$SOE':
-            in_data = True
-            continue
-        if line == '$$EOE':
-            break
-            
-        if not in_data or not line or line.startswith('>'):
-            continue
-        
-        parts = [p.strip() for p in line.split(',')]
-        
-        
-        if len(parts) >= 5:
-            try:
-                # Parse datetime and set to UTC+10
-                
-                dt_naive = datetime.strptime(parts[0], '%Y-%b-%d %H:%M:%S.000')
-                
-                dt_aware = tz.localize(dt_naive)
-                
-                unix_time = int(dt_aware.timestamp())
-                az = float(parts[3])
-                el = float(parts[4])
-                results.append((unix_time, az, el))
-            except ValueError, IndexError:
+
+def parse_ephemeris(file_path):
+    """Parse a Horizons result file into {unix_second: (az, el)}."""
+    # Locate the $$SOE/$$EOE data block by line number with a streaming
+    # pass; everything outside it is header/footer text, and nothing
+    # forces the whole multi-day file into one string
+    soe = eoe = None
+    with open(file_path, 'r') as f:
+        for i, line in enumerate(f):
+            if soe is None:
+                if line.startswith('$$SOE'):
+                    soe = i
+            elif line.startswith('$$EOE'):
+                eoe = i
+                break
+    if soe is None or eoe is None or eoe - soe < 2:
+        return {}
+
+    if _HAVE_PANDAS:
+        # One C-level CSV pass over just the block, reading straight
+        # from the file; malformed rows coerce to NaN/NaT and drop out
+        # with the ok mask below
+        df = pd.read_csv(file_path, header=None, usecols=[0, 3, 4],
+                         skipinitialspace=True, names=['when', 'az', 'el'],
+                         skiprows=soe + 1, nrows=eoe - soe - 1)
+        when = pd.to_datetime(df['when'], format='%Y-%b-%d %H:%M:%S.000',
+                              errors='coerce')
+        az = pd.to_numeric(df['az'], errors='coerce')
+        el = pd.to_numeric(df['el'], errors='coerce')
+        ok = when.notna() & az.notna() & el.notna()
+        # Timestamps are labeled UTC+10, so shift the as-UTC epoch back
+        unix = when[ok].astype('int64') // 10**9 - 36000
+        return dict(zip(unix.tolist(), zip(az[ok].tolist(), el[ok].tolist())))
+
+    # Keyed by unix second so the tracking loop is one hash lookup;
+    # iterating the handle processes one line at a time instead of
+    # materializing every line as a list up front
+    results = {}
+    with open(file_path, 'r') as f:
+        for i, line in enumerate(f):
+            if i <= soe:
+                continue
+            if i >= eoe:
+                break
+            line = line.strip()
+            if not line or line.startswith('>'):
                 continue
+
+            parts = [p.strip() for p in line.split(',')]
+
+            if len(parts) >= 5:
+                try:
+                    # The format and the +10h offset are fixed, so slice
+                    # the fields and use timegm arithmetic instead of
+                    # strptime's format interpreter and pytz's tzinfo
+                    # machinery
+                    ts = parts[0]
+                    unix_time = calendar.timegm((
+                        int(ts[0:4]), _MONTHS[ts[5:8]], int(ts[9:11]),
+                        int(ts[12:14]), int(ts[15:17]), int(ts[18:20]),
+                        0, 0, 0)) - 36000
+                    az = float(parts[3])
+                    el = float(parts[4])
+                    results[unix_time] = (az, el)
+                except (ValueError, IndexError, KeyError):
+                    continue
     return results
 
 # Usage:
-parsed = parse_ephemeris_tuples(data)
+parsed = parse_ephemeris(DATA_FILE)
+print(f"Parsed {len(parsed)} ephemeris entries from {DATA_FILE}.")
+
+# Byte commands are formatted once up front, so the timed loop does
+# nothing but sleep, log, and send
+schedule = [(event_sec, az, el, f"AZ:{az} ALT:{el}\n".encode('ascii'))
+            for event_sec, (az, el) in sorted(parsed.items())]
 
-while True:
-    current_sec = int(time.time())  # CRITICAL: Must floor to integer seconds (matches your list's integer timestamps)
-    for entry in parsed:
-        if entry[0] == current_sec:  # Exact second match (works even with irregular gaps)
-            print(f"MATCH: {entry} (Unix time {entry[0]} = UTC {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(entry[0]))})")
-            send_position(f"AZ:{entry[1]} ALT:{entry[2]}")
-    time.sleep(1)  # Check exactly once per second (optimal for integer timestamps - never misses)
\ No newline at end of file
+# Sleep until each scheduled second instead of polling every second;
+# entries already in the past are skipped on startup
+for event_sec, az, el, cmd in schedule:
+    delay = event_sec - time.time()
+    if delay < -1:
+        continue
+    if delay > 0:
+        time.sleep(delay)
+    print(f"MATCH: ({event_sec}, {az}, {el}) (Unix time {event_sec} = UTC {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(event_sec))})")
+    send_position(cmd)
\ No newline at end of file
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import time
-import re
+import math
+import functools
 import os
 import sys
 import glob
@@ -12,15 +13,51 @@ from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.animation import FuncAnimation
 from collections import deque
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from port_utils import set_low_latency
+import requests
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    # orjson is optional; stdlib json handles the feed fine, just slower.
+    import json
+    _HAVE_ORJSON = False
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional here too; plain Python kernels still work.
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
 
 BAUD_RATE_DEFAULT = 115200
 
 ser = None
 connected = False
+_first_open = True   # the post-open settle sleep is only paid once
+_next_try = 0.0      # monotonic deadline for the next reconnect attempt
+_RECONNECT_BACKOFF = 2.0
+
+# Track sincos lookup: ADS-B track is quantized to whole degrees, so a
+# 360-entry table replaces two transcendental calls per prediction
+# (<0.01 m/km of error from the 1-degree quantization)
+_COS_TRACK = np.cos(np.radians(np.arange(360)))
+_SIN_TRACK = np.sin(np.radians(np.arange(360)))
+
+# bytes %-formatting renders the wire payload in one C call, with no
+# intermediate str or per-send encode
+CMD_FMT = b"AZ:%.5f ALT:%.5f\n"
 
 # Global variable for prediction time (seconds)
 prediction_time = 0.0
@@ -30,24 +67,44 @@ prediction_lock = threading.Lock()
 plot_data_lock = threading.Lock()
 MAX_POINTS = 100  # Maximum number of points to display
 
-# Data storage for plotting
-actual_positions = deque(maxlen=MAX_POINTS)
-predicted_positions = deque(maxlen=MAX_POINTS)
+# Data storage for plotting: structure-of-arrays ring buffers, so each
+# GUI tick hands matplotlib contiguous arrays instead of rebuilding
+# lists from a deque of tuples
+_act_lat = np.empty(MAX_POINTS)
+_act_lon = np.empty(MAX_POINTS)
+_pred_lat = np.empty(MAX_POINTS)
+_pred_lon = np.empty(MAX_POINTS)
+_path_t = np.empty(MAX_POINTS)
+_path_head = 0   # next write slot
+_path_count = 0  # valid entries (saturates at MAX_POINTS)
+
 prediction_errors = deque(maxlen=MAX_POINTS)  # Actual prediction errors
 error_timestamps = deque(maxlen=MAX_POINTS)   # Timestamps for errors
-timestamps = deque(maxlen=MAX_POINTS)
 start_time = None
 
-# Buffer to store predictions for later comparison
-# Format: {timestamp: (predicted_lat, predicted_lon, prediction_time_used)}
-prediction_buffer = {}
+
+def _ring_view(arr):
+    """Valid ring contents in insertion order (copies only when wrapped)."""
+    if _path_count < MAX_POINTS:
+        return arr[:_path_count]
+    return np.concatenate((arr[_path_head:], arr[:_path_head]))
+
+# Buffer to store predictions for later comparison. Entries arrive in
+# timestamp order, so a deque lets expired entries fall off the left in
+# O(1) instead of a full-dict scan per update.
+# Format: (timestamp, predicted_lat, predicted_lon, prediction_time_used)
+prediction_buffer = deque()
 BUFFER_MAX_AGE = 30  # Keep predictions for up to 30 seconds
 
 # Current values for display
 current_error = 0.0
 current_actual = (0.0, 0.0)
 current_predicted = (0.0, 0.0)
+# Latest aircraft state for trajectory rendering:
+# (lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm)
+current_state = None
 avg_error = 0.0
+_err_sum = 0.0  # Running sum of prediction_errors for an O(1) average
 
 # Home position (will be loaded from config)
 home_lat = None
@@ -100,32 +157,66 @@ def load_config(config_path):
         sys.exit(1)
 
 
+@njit(cache=True, fastmath=True)
+def _haversine_scalar(lat1, lon1, lat2, lon2):
+    """Scalar haversine in meters; compiles to libm trig under Numba."""
+    lat1r = math.radians(lat1)
+    lat2r = math.radians(lat2)
+    dlat = lat2r - lat1r
+    dlon = math.radians(lon2 - lon1)
+    a = (math.sin(dlat * 0.5) ** 2
+         + math.cos(lat1r) * math.cos(lat2r) * math.sin(dlon * 0.5) ** 2)
+    return 2.0 * 6371000.0 * math.asin(math.sqrt(a))
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _haversine_batch(lat1, lon1, lat2, lon2, out):
+    for i in prange(lat1.shape[0]):
+        out[i] = _haversine_scalar(lat1[i], lon1[i], lat2[i], lon2[i])
+
+
 def haversine_distance(lat1, lon1, lat2, lon2):
     """
     Calculate the great circle distance between two points 
     on the earth (specified in decimal degrees).
     Returns distance in meters.
     """
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    
-    # Haversine formula
+    # The hot calls from update_plot_data pass scalars; route those
+    # through the compiled kernel instead of NumPy's ufunc machinery
+    if (isinstance(lat1, (int, float)) and isinstance(lon1, (int, float))
+            and isinstance(lat2, (int, float)) and isinstance(lon2, (int, float))):
+        return _haversine_scalar(lat1, lon1, lat2, lon2)
+
+    lat1 = np.ascontiguousarray(lat1, dtype=np.float64)
+    lon1 = np.ascontiguousarray(lon1, dtype=np.float64)
+    lat2 = np.ascontiguousarray(lat2, dtype=np.float64)
+    lon2 = np.ascontiguousarray(lon2, dtype=np.float64)
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+
+    if _HAVE_NUMBA:
+        out = np.empty(lat1.shape, dtype=np.float64)
+        _haversine_batch(lat1.ravel(), lon1.ravel(), lat2.ravel(),
+                         lon2.ravel(), out.ravel())
+        return out
+
+    # NumPy fallback for the buffered-prediction batches
+    lat1 = np.radians(lat1)
+    lon1 = np.radians(lon1)
+    lat2 = np.radians(lat2)
+    lon2 = np.radians(lon2)
     dlat = lat2 - lat1
     dlon = lon2 - lon1
     a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-    c = 2 * np.arcsin(np.sqrt(a))
-    
-    # Earth's radius in meters
-    r = 6371000
-    return c * r
+    return 2 * 6371000 * np.arcsin(np.sqrt(a))
 
 
-def update_plot_data(actual_lat, actual_lon, predicted_lat, predicted_lon, pred_time_used):
+def update_plot_data(actual_lat, actual_lon, predicted_lat, predicted_lon, pred_time_used, state=None):
     """
     Thread-safe update of plot data.
     Stores current prediction and checks past predictions against current actual position.
     """
     global start_time, current_error, current_actual, current_predicted, avg_error, prediction_buffer
+    global _path_head, _path_count, _err_sum, current_state
     
     with plot_data_lock:
         if start_time is None:
@@ -135,51 +226,76 @@ def update_plot_data(actual_lat, actual_lon, predicted_lat, predicted_lon, pred_
         absolute_time = time.time()
         
         # Store positions for path plotting
-        actual_positions.append((actual_lat, actual_lon, current_time))
-        predicted_positions.append((predicted_lat, predicted_lon, current_time))
-        timestamps.append(current_time)
+        i = _path_head
+        _act_lat[i] = actual_lat
+        _act_lon[i] = actual_lon
+        _pred_lat[i] = predicted_lat
+        _pred_lon[i] = predicted_lon
+        _path_t[i] = current_time
+        _path_head = (i + 1) % MAX_POINTS
+        _path_count = min(_path_count + 1, MAX_POINTS)
         
         current_actual = (actual_lat, actual_lon)
         current_predicted = (predicted_lat, predicted_lon)
+        if state is not None:
+            current_state = state
         
         # Store this prediction for future comparison
         if pred_time_used > 0:
-            prediction_buffer[absolute_time] = (predicted_lat, predicted_lon, pred_time_used)
-        
-        # Check past predictions against current actual position
-        predictions_to_remove = []
-        
-        for pred_timestamp, (pred_lat, pred_lon, pred_dt) in prediction_buffer.items():
-            age = absolute_time - pred_timestamp
+            prediction_buffer.append((absolute_time, predicted_lat, predicted_lon, pred_time_used))
+        
+        # Age out expired predictions from the left; insertion order is
+        # time order, so this is O(evicted) rather than a full scan
+        while prediction_buffer:
+            ts, _, _, pred_dt = prediction_buffer[0]
+            age = absolute_time - ts
+            if age > pred_dt + 2 or age > BUFFER_MAX_AGE:
+                prediction_buffer.popleft()
+            else:
+                break
+        
+        # Score the (typically few) remaining entries that have matured,
+        # with a single vectorized haversine call for the whole batch
+        ready_lats = []
+        ready_lons = []
+        kept = []
+        dropped = False
+        
+        for entry in prediction_buffer:
+            ts, pred_lat, pred_lon, pred_dt = entry
+            age = absolute_time - ts
             
             # If this prediction's target time has arrived (within a tolerance window)
-            time_diff = abs(age - pred_dt)
-            
-            if time_diff < 0.75:  # Within 0.75 second tolerance
-                # Calculate error between what we predicted and where aircraft actually is
-                error = haversine_distance(pred_lat, pred_lon, actual_lat, actual_lon)
-                
+            if abs(age - pred_dt) < 0.75:  # Within 0.75 second tolerance
+                ready_lats.append(pred_lat)
+                ready_lons.append(pred_lon)
+                dropped = True
+            elif age > pred_dt + 2 or age > BUFFER_MAX_AGE:
+                # Expired mid-queue (prediction time changed); discard
+                dropped = True
+            else:
+                kept.append(entry)
+        
+        if dropped:
+            prediction_buffer.clear()
+            prediction_buffer.extend(kept)
+        
+        if ready_lats:
+            errors = np.atleast_1d(haversine_distance(
+                np.asarray(ready_lats), np.asarray(ready_lons),
+                actual_lat, actual_lon))
+            for error in errors:
+                # Keep the running sum in step with the deque's eviction
+                if len(prediction_errors) == MAX_POINTS:
+                    _err_sum -= prediction_errors[0]
                 prediction_errors.append(error)
+                _err_sum += error
                 error_timestamps.append(current_time)
-                current_error = error
-                
-                predictions_to_remove.append(pred_timestamp)
-            
-            # Remove old predictions that we'll never match
-            elif age > pred_dt + 2:  # More than 2 seconds past target time
-                predictions_to_remove.append(pred_timestamp)
-            
-            # Also remove very old predictions to prevent memory buildup
-            elif age > BUFFER_MAX_AGE:
-                predictions_to_remove.append(pred_timestamp)
-        
-        # Clean up processed/old predictions
-        for ts in predictions_to_remove:
-            del prediction_buffer[ts]
+            current_error = float(errors[-1])
         
-        # Calculate average error
+        # Calculate average error from the running sum
         if len(prediction_errors) > 0:
-            avg_error = sum(prediction_errors) / len(prediction_errors)
+            avg_error = _err_sum / len(prediction_errors)
 
 
 class PlotGUI:
@@ -279,6 +395,7 @@ class PlotGUI:
         self.predicted_line, = self.ax_pos.plot([], [], 'r--', label='Predicted', linewidth=1.5, alpha=0.7)
         self.actual_point, = self.ax_pos.plot([], [], 'bo', markersize=8)
         self.predicted_point, = self.ax_pos.plot([], [], 'r^', markersize=8)
+        self.traj_line, = self.ax_pos.plot([], [], 'r:', linewidth=1.2, alpha=0.9, label='Predicted path')
         self.ax_pos.legend(loc='upper left')
         
         # Error plot (right)
@@ -300,6 +417,7 @@ class PlotGUI:
         canvas_frame.pack(fill=tk.BOTH, expand=True)
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=canvas_frame)
+        
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -312,8 +430,12 @@ class PlotGUI:
         )
         explain_label.pack(pady=5)
         
-        # Start update loop
-        self.update_plot()
+        # FuncAnimation owns the redraw timer and the blit
+        # bookkeeping, re-snapshotting its saved background whenever a
+        # full draw happens
+        self._lims = None
+        self.anim = FuncAnimation(self.fig, self._anim_step, interval=100,
+                                  blit=True, cache_frame_data=False)
     
     def on_slider_change(self, val):
         global prediction_time
@@ -321,34 +443,52 @@ class PlotGUI:
             prediction_time = float(val)
         self.value_label.config(text=f"{float(val):.1f} s")
     
-    def update_plot(self):
-        """Update the plots with latest data."""
+    def _anim_step(self, frame):
+        """Per-frame animation callback: refresh data, return artists."""
         with plot_data_lock:
-            if len(actual_positions) > 0:
-                # Update position plot
-                actual_lats = [p[0] for p in actual_positions]
-                actual_lons = [p[1] for p in actual_positions]
-                pred_lats = [p[0] for p in predicted_positions]
-                pred_lons = [p[1] for p in predicted_positions]
+            if _path_count > 0:
+                # Update position plot straight from the ring buffers
+                actual_lats = _ring_view(_act_lat)
+                actual_lons = _ring_view(_act_lon)
+                pred_lats = _ring_view(_pred_lat)
+                pred_lons = _ring_view(_pred_lon)
                 
                 self.actual_line.set_data(actual_lons, actual_lats)
                 self.predicted_line.set_data(pred_lons, pred_lats)
                 
                 # Update current position markers
-                if len(actual_positions) > 0:
-                    self.actual_point.set_data([actual_lons[-1]], [actual_lats[-1]])
-                    self.predicted_point.set_data([pred_lons[-1]], [pred_lats[-1]])
+                self.actual_point.set_data([actual_lons[-1]], [actual_lats[-1]])
+                self.predicted_point.set_data([pred_lons[-1]], [pred_lats[-1]])
+                
+                # Predicted trajectory out to the slider's lead time,
+                # one vectorized pass instead of a Python loop
+                with prediction_lock:
+                    lead = prediction_time
+                if lead > 0 and current_state is not None:
+                    dts = np.linspace(0.0, lead, 16)
+                    traj_lats, traj_lons, _ = get_future_position_vec(
+                        *current_state, dts)
+                    self.traj_line.set_data(traj_lons, traj_lats)
+                else:
+                    traj_lats = traj_lons = None
+                    self.traj_line.set_data([], [])
                 
                 # Auto-scale position plot
-                if len(actual_lons) > 0:
-                    all_lons = actual_lons + pred_lons
-                    all_lats = actual_lats + pred_lats
-                    
-                    lon_margin = max(0.001, (max(all_lons) - min(all_lons)) * 0.1)
-                    lat_margin = max(0.001, (max(all_lats) - min(all_lats)) * 0.1)
-                    
-                    self.ax_pos.set_xlim(min(all_lons) - lon_margin, max(all_lons) + lon_margin)
-                    self.ax_pos.set_ylim(min(all_lats) - lat_margin, max(all_lats) + lat_margin)
+                lon_min = min(actual_lons.min(), pred_lons.min())
+                lon_max = max(actual_lons.max(), pred_lons.max())
+                lat_min = min(actual_lats.min(), pred_lats.min())
+                lat_max = max(actual_lats.max(), pred_lats.max())
+                if traj_lons is not None:
+                    lon_min = min(lon_min, traj_lons.min())
+                    lon_max = max(lon_max, traj_lons.max())
+                    lat_min = min(lat_min, traj_lats.min())
+                    lat_max = max(lat_max, traj_lats.max())
+                
+                lon_margin = max(0.001, (lon_max - lon_min) * 0.1)
+                lat_margin = max(0.001, (lat_max - lat_min) * 0.1)
+                
+                self.ax_pos.set_xlim(lon_min - lon_margin, lon_max + lon_margin)
+                self.ax_pos.set_ylim(lat_min - lat_margin, lat_max + lat_margin)
                 
                 # Update error plot
                 if len(prediction_errors) > 0:
@@ -379,11 +519,19 @@ class PlotGUI:
                 self.buffer_label.config(text=f"Pending: {len(prediction_buffer)}")
                 self.actual_label.config(text=f"Lat: {current_actual[0]:.6f}, Lon: {current_actual[1]:.6f}")
                 self.predicted_label.config(text=f"Lat: {current_predicted[0]:.6f}, Lon: {current_predicted[1]:.6f}")
-                
-                self.canvas.draw_idle()
         
-        # Schedule next update
-        self.root.after(200, self.update_plot)
+        # Blitting leaves ticks and grid untouched, so when the
+        # autoscaled limits actually move, request one full draw; the
+        # animation re-captures its background from that draw event
+        lims = (self.ax_pos.get_xlim(), self.ax_pos.get_ylim(),
+                self.ax_err.get_xlim(), self.ax_err.get_ylim())
+        if lims != self._lims:
+            self._lims = lims
+            self.canvas.draw_idle()
+        
+        return (self.actual_line, self.predicted_line,
+                self.actual_point, self.predicted_point,
+                self.traj_line, self.err_line, self.avg_line)
     
     def run(self):
         self.root.mainloop()
@@ -395,6 +543,7 @@ def create_gui():
     gui.run()
 
 
+@njit(cache=True, fastmath=True)
 def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm, dt_seconds):
     """
     Predicts future position based on current state and time delta.
@@ -423,17 +572,18 @@ def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm, dt
     # Calculate distance traveled in dt_seconds
     distance_m = speed_mps * dt_seconds
     
-    # Convert track to radians (0=North, clockwise)
-    track_rad = np.radians(track_deg)
+    # Track is whole-degree quantized upstream; index the tables
+    # instead of calling sin/cos (0=North, clockwise)
+    idx = int(track_deg) % 360
     
     # Calculate displacement in North and East directions
-    delta_north = distance_m * np.cos(track_rad)
-    delta_east = distance_m * np.sin(track_rad)
+    delta_north = distance_m * _COS_TRACK[idx]
+    delta_east = distance_m * _SIN_TRACK[idx]
     
     # Convert displacement to lat/lon changes
     # Approximate meters per degree at given latitude
     meters_per_deg_lat = 111320.0  # Roughly constant
-    meters_per_deg_lon = 111320.0 * np.cos(np.radians(lat))
+    meters_per_deg_lon = 111320.0 * math.cos(math.radians(lat))
     
     # Calculate new position
     future_lat = lat + (delta_north / meters_per_deg_lat)
@@ -446,18 +596,70 @@ def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm, dt
     return future_lat, future_lon, future_alt_m
 
 
+@functools.lru_cache(maxsize=4096)
+def _mpd_lon(lat_bucket):
+    """Meters per degree of longitude, memoized on ~1 km lat buckets."""
+    return 111320.0 * math.cos(math.radians(lat_bucket))
+
+
+def get_future_position_vec(lat, lon, alt_m, track_deg, speed_kts,
+                            vert_rate_fpm, dt_seconds):
+    """
+    Vectorized get_future_position over an array of lead times.
+
+    The per-state trig (track sincos, meters-per-degree at the current
+    latitude) is computed once as scalars; only the dt-dependent
+    arithmetic broadcasts, so a whole trajectory costs one C pass.
+
+    Returns:
+        tuple: (lats, lons, alts_m) as np.ndarrays matching dt_seconds
+    """
+    dt = np.asarray(dt_seconds, dtype=np.float64)
+    
+    speed_mps = speed_kts * 0.514444
+    vert_rate_mps = vert_rate_fpm * 0.3048 / 60.0
+    track_rad = math.radians(track_deg)
+    
+    meters_per_deg_lat = 111320.0
+    # Latitude moves slowly; a 0.01-degree bucket (~1.1 km) is far finer
+    # than the flat-earth approximation, so the cos is cached
+    meters_per_deg_lon = _mpd_lon(round(lat, 2))
+    
+    distance_m = speed_mps * dt
+    future_lat = lat + distance_m * (math.cos(track_rad) / meters_per_deg_lat)
+    future_lon = lon + distance_m * (math.sin(track_rad) / meters_per_deg_lon)
+    future_alt = alt_m + vert_rate_mps * dt
+    return future_lat, future_lon, future_alt
+
+
 def send_position(cmd, port, baud):
-    """Send command over serial, handling reconnects."""
-    global ser, connected
+    """Send a byte command over serial, handling reconnects lazily.
+
+    Reconnect attempts run on a backoff deadline and the Arduino
+    DTR-reset settle sleep is paid on the first open only, so a dead
+    port never stalls the tracking loop tick after tick.
+    """
+    global ser, connected, _first_open, _next_try
     
-    print(f"---> {cmd}")
+    print("--->", cmd.decode('ascii'), end='')
     
     if not connected:
+        now = time.monotonic()
+        if now < _next_try:
+            return  # still backing off; try again on a later tick
         try:
             if ser:
                 ser.close()
-            ser = serial.Serial(port, baud, timeout=5)
-            time.sleep(2)
+            # write_timeout=0 makes writes non-blocking: they land in
+            # the kernel buffer or raise immediately, never stalling
+            # the tracking loop behind a slow UART
+            ser = serial.Serial(port, baud, timeout=5, write_timeout=0)
+            set_low_latency(ser)
+            if _first_open:
+                # Boards that reset on DTR need a moment to boot; on
+                # later reconnects the firmware is already running
+                time.sleep(2)
+                _first_open = False
             connected = True
             print(f"Connected to {port} at {baud} baud.")
         except (serial.SerialException, OSError) as e:
@@ -473,12 +675,16 @@ def send_position(cmd, port, baud):
                 print("Or run the script with sudo (not recommended long-term).")
             ser = None
             connected = False
+            _next_try = now + _RECONNECT_BACKOFF
             return
 
     if connected:
         try:
-            ser.write((cmd + "\n").encode())
-            time.sleep(0.1)
+            ser.write(cmd)
+        except serial.SerialTimeoutException:
+            # Kernel tx buffer full; drop this command rather than
+            # block — a fresher position goes out next tick anyway
+            print("Serial backpressure, command dropped.")
         except (serial.SerialException, OSError) as e:
             print(f"Error sending data: {e}. Will reconnect next loop.")
             if ser:
@@ -505,15 +711,25 @@ def cleanup():
     print("Serial connection closed.")
 
 
-def string_to_float(s):
-    """Extract latitude and longitude from position string."""
-    pattern = r"(-?\d+\.?\d*)"
-    matches = re.findall(pattern, s)
-    
-    if len(matches) == 2:
-        latitude = float(matches[0])
-        longitude = float(matches[1])
-        return latitude, longitude
+def fetch_aircraft_state(session, url, icao):
+    """
+    Fetch one aircraft's state dict from an aircraft.json feed.
+
+    A plain keep-alive GET plus one JSON parse replaces the old Selenium
+    DOM scrape — no browser, no XPath, no regex field extraction.
+
+    Returns:
+        dict for the matching ICAO, or None if it is not in the feed.
+    """
+    resp = session.get(url, timeout=5)
+    resp.raise_for_status()
+    if _HAVE_ORJSON:
+        data = orjson.loads(resp.content)
+    else:
+        data = json.loads(resp.content)
+    for ac in data.get('aircraft', []):
+        if ac.get('hex', '').lower() == icao:
+            return ac
     return None
 
 
@@ -521,49 +737,70 @@ def string_to_float(s):
 a = 6378137.0         # Semi-major axis (meters)
 f = 1 / 298.257223563   # Flattening
 e_sq = f * (2 - f)    # Square of first eccentricity
+_ONE_MINUS_ESQ = 1.0 - e_sq
 
 
+@njit(cache=True, fastmath=True)
 def lla_to_ecef(lat, lon, alt):
-    """Converts LLA (degrees, meters) to ECEF (meters)"""
-    lat_rad = np.radians(lat)
-    lon_rad = np.radians(lon)
-    N = a / np.sqrt(1 - e_sq * np.sin(lat_rad)**2)
-    X = (N + alt) * np.cos(lat_rad) * np.cos(lon_rad)
-    Y = (N + alt) * np.cos(lat_rad) * np.sin(lon_rad)
-    Z = ((1 - e_sq) * N + alt) * np.sin(lat_rad)
-    return np.array([X, Y, Z])
+    """Converts LLA (degrees, meters) to ECEF (meters) as an (X, Y, Z) tuple."""
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    N = a / math.sqrt(1.0 - e_sq * sin_lat * sin_lat)
+    Nh = N + alt
+    X = Nh * cos_lat * math.cos(lon_rad)
+    Y = Nh * cos_lat * math.sin(lon_rad)
+    Z = (_ONE_MINUS_ESQ * N + alt) * sin_lat
+    return X, Y, Z
+
+
+@functools.lru_cache(maxsize=64)
+def _lla_to_ecef_cached(lat_r, lon_r, alt_r):
+    """lla_to_ecef memoized on pre-rounded inputs.
+
+    Rounding to (1e-6 deg, 1e-6 deg, 0.1 m) is roughly 1 m of position —
+    far below pointing accuracy — so ticks where the aircraft has not
+    appreciably moved skip the trig entirely.
+    """
+    return lla_to_ecef(lat_r, lon_r, alt_r)
 
 
-def get_az_alt(user_ecef, user_lat_rad, user_lon_rad, ac_ecef):
-    """
-    Calculates Az/Alt from ECEF vectors.
-    Pre-calculating user_ecef and rotation matrix parts saves CPU time
-    in the fast loop.
-    """
-    
+@njit(cache=True, fastmath=True)
+def _get_az_alt_scalar(ux, uy, uz, sin_lat, cos_lat, sin_lon, cos_lon,
+                       ax, ay, az):
+    """Scalar Az/Alt kernel over unpacked ECEF components."""
     # Get the vector from user to aircraft in ECEF frame
-    vec_ecef = ac_ecef - user_ecef
+    vx = ax - ux
+    vy = ay - uy
+    vz = az - uz
     
     # Rotate the vector into the user's local ENU (East, North, Up) frame
-    sin_lon = np.sin(user_lon_rad)
-    cos_lon = np.cos(user_lon_rad)
-    sin_lat = np.sin(user_lat_rad)
-    cos_lat = np.cos(user_lat_rad)
+    e = -sin_lon * vx + cos_lon * vy
+    n = -sin_lat * cos_lon * vx - sin_lat * sin_lon * vy + cos_lat * vz
+    u = cos_lat * cos_lon * vx + cos_lat * sin_lon * vy + sin_lat * vz
     
-    e = -sin_lon * vec_ecef[0] + cos_lon * vec_ecef[1]
-    n = -sin_lat * cos_lon * vec_ecef[0] - sin_lat * sin_lon * vec_ecef[1] + cos_lat * vec_ecef[2]
-    u = cos_lat * cos_lon * vec_ecef[0] + cos_lat * sin_lon * vec_ecef[1] + sin_lat * vec_ecef[2]
-    
-    # Convert ENU coordinates to Azimuth and Altitude
-    alt_rad = np.arcsin(u / np.linalg.norm([e, n, u]))
-    az_rad = np.arctan2(e, n)
-    
-    alt_deg = np.degrees(alt_rad)
-    az_deg = (np.degrees(az_rad) + 360) % 360  # Normalize to 0-360
+    # Convert ENU coordinates to Azimuth and Altitude. Float % with a
+    # positive divisor is already non-negative, so no +360 fixup needed.
+    alt_deg = math.degrees(math.asin(u / math.sqrt(e * e + n * n + u * u)))
+    az_deg = math.degrees(math.atan2(e, n)) % 360.0
     
     return az_deg, alt_deg
 
 
+def get_az_alt(user_ecef, user_trig, ac_ecef):
+    """
+    Calculates Az/Alt from ECEF vectors.
+    Pre-calculating user_ecef and the sincos of the home position saves
+    CPU time in the fast loop; the unpacked-scalar kernel lets Numba
+    compile straight libm trig with no tuple or array traffic.
+    """
+    sin_lat, cos_lat, sin_lon, cos_lon = user_trig
+    return _get_az_alt_scalar(user_ecef[0], user_ecef[1], user_ecef[2],
+                              sin_lat, cos_lat, sin_lon, cos_lon,
+                              ac_ecef[0], ac_ecef[1], ac_ecef[2])
+
+
 def main():
     # Load config
     config_path = 'data/config.txt'
@@ -579,49 +816,58 @@ def main():
 
     print(f"Using serial port: {port} at {BAUD_RATE_DEFAULT} baud")
 
-    # Pre-calculate ECEF and lat/lon for home position
+    # Pre-calculate ECEF and the home sincos once; the tracking loop
+    # then does no trig for the fixed observer at all
     homecef = lla_to_ecef(home[0], home[1], home[2])
-    homelat = np.radians(home[0])
-    homelon = np.radians(home[1])
+    homelat = math.radians(home[0])
+    homelon = math.radians(home[1])
+    hometrig = (math.sin(homelat), math.cos(homelat),
+                math.sin(homelon), math.cos(homelon))
 
     # Start GUI in a separate thread
     gui_thread = threading.Thread(target=create_gui, daemon=True)
     gui_thread.start()
 
-    # ICAO code and Selenium setup
-    icao = ""  # Replace with desired ICAO code
-    url = f"https://globe.adsbexchange.com/?icao={icao}"
-    
-    driver = webdriver.Firefox()
-    firefox_options = FirefoxOptions()
+    # ICAO code and JSON feed setup; one keep-alive session replaces the
+    # Firefox renderer the old Selenium scrape dragged along
+    icao = ""  # Replace with desired ICAO code (lowercase hex)
+    data_url = os.environ.get(
+        "AIRCRAFT_JSON_URL", "http://127.0.0.1:8080/data/aircraft.json")
+    session = requests.Session()
 
     try:
-        driver.get(url)
-        time.sleep(9)  # Wait for the page to load
-
-        pos = driver.find_element(By.CLASS_NAME, 'infoData')
+        # Deadline scheduling: sleep only for whatever remains of each
+        # 0.3 s tick, so a slow fetch eats into the sleep instead of
+        # stacking on top of it
+        tick = 0.3
+        next_tick = time.monotonic()
         for i in range(200000):
-            position = pos.find_element(By.XPATH, '//*[@id="selected_position"]')  # lat lon
-            height = pos.find_element(By.XPATH, '//*[@id="selected_altitude_geom1"]')  # feet
-            track = pos.find_element(By.XPATH, '//*[@id="selected_track1"]')  # degrees
-            gspd = pos.find_element(By.XPATH, '//*[@id="selected_speed1"]')  # knots
-            vertspd = pos.find_element(By.XPATH, '//*[@id="selected_vert_rate"]')  # feet p min
+            try:
+                ac = fetch_aircraft_state(session, data_url, icao)
+            except (requests.RequestException, ValueError) as e:
+                print(f"Feed fetch failed: {e}. Retrying...")
+                time.sleep(5)
+                continue
             
-            acp = string_to_float(position.text)
-            ach = re.findall(r"(-?\d+\.?\d*)", height.text)
-            act = float(re.findall(r"(-?\d+\.?\d*)", track.text)[0])
-            acs = float(re.findall(r"(-?\d+\.?\d*)", gspd.text)[0])
-            acv = float(re.findall(r"(-?\d+\.?\d*)", vertspd.text)[0])
+            if ac is None or 'lat' not in ac or 'lon' not in ac:
+                time.sleep(5)
+                print("No position data, retrying...")
+                continue
+            
+            acp = (float(ac['lat']), float(ac['lon']))
+            ach = ac.get('alt_geom', ac.get('alt_baro'))
+            act = float(ac.get('track', 0.0))
+            acs = float(ac.get('gs', 0.0))
+            acv = float(ac.get('geom_rate', ac.get('baro_rate', 0.0)))
             
             print(f'Lat: {acp[0]} Lon: {acp[1]} Height: {ach} ft Track: {act} deg Speed: {acs} kts VeRTSPD: {acv} fpm')
             
-            if not ach:
+            if ach is None or ach == 'ground':
                 time.sleep(5)
                 print("No height data, retrying...")
                 continue
             
-            ach = float(ach[0])
-            achm = ach * 0.3048  # feet to meters
+            achm = float(ach) * 0.3048  # feet to meters
             
             # Get current prediction time from GUI slider (thread-safe)
             with prediction_lock:
@@ -637,27 +883,34 @@ def main():
                 future_lat, future_lon, future_alt_m = acp[0], acp[1], achm
             
             # Update plot data
-            update_plot_data(acp[0], acp[1], future_lat, future_lon, current_prediction_time)
-
-            accef = lla_to_ecef(future_lat, future_lon, future_alt_m)
-            azalt = get_az_alt(homecef, homelat, homelon, accef)
-            print(np.array(azalt))
+            update_plot_data(acp[0], acp[1], future_lat, future_lon, current_prediction_time,
+                             state=(acp[0], acp[1], achm, act, acs, acv))
+
+            accef = _lla_to_ecef_cached(round(future_lat, 6),
+                                        round(future_lon, 6),
+                                        round(future_alt_m, 1))
+            azalt = get_az_alt(homecef, hometrig, accef)
+            print(f"AZ={azalt[0]:.3f} ALT={azalt[1]:.3f}")
             
             if azalt[1] < -30 or azalt[1] > 54:
                 print("Beyond limits, skipping...")
             else:
-                send_position(f"AZ:{azalt[0]:.5f} ALT:{azalt[1]:.5f}", port, BAUD_RATE_DEFAULT)
+                send_position(CMD_FMT % (azalt[0], azalt[1]), port, BAUD_RATE_DEFAULT)
             
-            time.sleep(0.3)
+            next_tick += tick
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (slow scrape); re-anchor rather than
+                # bursting to catch up
+                next_tick = time.monotonic()
     
     except KeyboardInterrupt:
         print('\nInterrupted by user.')
     finally:
         cleanup()
-        try:
-            driver.quit()
-        except Exception:
-            pass
+        session.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,51 @@
+"""Serial-port discovery shared by the tracking and test scripts."""
+
+import array
+import glob
+import os
+
+# From <linux/serial.h>: serial_struct ioctls and the flag bit
+_TIOCGSERIAL = 0x541E
+_TIOCSSERIAL = 0x541F
+_ASYNC_LOW_LATENCY = 0x2000
+
+SERIAL_PORT_PATTERNS = ['/dev/serial/by-id/*', '/dev/ttyUSB*',
+                        '/dev/ttyACM*', '/dev/cu.*']
+
+
+def find_serial_port(preferred=None):
+    """Pick a serial port: explicit arg, then SERIAL_PORT env, then scan."""
+    if preferred:
+        return preferred
+    env_port = os.environ.get("SERIAL_PORT")
+    if env_port:
+        return env_port
+
+    if os.name == 'nt':
+        return 'COM5'
+
+    matches = []
+    for p in SERIAL_PORT_PATTERNS:
+        matches.extend(glob.glob(p))
+    matches = sorted(matches)
+    return matches[0] if matches else None
+
+
+def set_low_latency(ser):
+    """Put an open pyserial port into the driver's low-latency mode.
+
+    ftdi_sio coalesces reads (and delays write completion) over a 16 ms
+    window by default; the ASYNC_LOW_LATENCY flag drops that to ~1 ms.
+    Ports whose drivers reject the ioctl (ACM/USB-CDC, or non-Linux)
+    are left as-is — they have no such window to begin with.
+    """
+    if os.name == 'nt':
+        return
+    try:
+        import fcntl
+        buf = array.array('i', [0] * 32)
+        fcntl.ioctl(ser.fileno(), _TIOCGSERIAL, buf)
+        buf[4] |= _ASYNC_LOW_LATENCY
+        fcntl.ioctl(ser.fileno(), _TIOCSSERIAL, buf)
+    except (ImportError, OSError, ValueError):
+        pass
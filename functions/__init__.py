@@ -1,17 +1,23 @@
 """Functions package for ADS-B tracking system."""
 
 from .config import load_config
-from .coordinates import lla_to_ecef, get_az_alt, get_future_position
-from .data_parser import haversine_distance, parse_position_string, parse_float_value, feet_to_meters
+from .coordinates import Observer, lla_to_ecef, ecef_to_lla, get_az_alt, get_az_alt_batch, get_future_position
+from .data_parser import (haversine_distance, haversine_one_to_many, ecef_distance,
+                          parse_position_string, parse_float_value, feet_to_meters)
 from .serial_handler import SerialHandler
 from .gui import create_gui, update_plot_data, get_prediction_time
 
 __all__ = [
     'load_config',
+    'Observer',
     'lla_to_ecef',
+    'ecef_to_lla',
     'get_az_alt',
+    'get_az_alt_batch',
     'get_future_position',
     'haversine_distance',
+    'haversine_one_to_many',
+    'ecef_distance',
     'parse_position_string',
     'parse_float_value',
     'feet_to_meters',
@@ -0,0 +1,72 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Optional Cython build of the hot coordinate kernels.
+
+Build with ``cythonize -i functions/_coord_c.pyx`` to get AOT-compiled
+versions of the scalar LLA-to-ECEF conversion, the az/alt kernel, and a
+batched LLA-to-ECEF loop. coordinates.py picks these up automatically
+when the extension is present and falls back to the pure-Python/Numba
+paths otherwise.
+"""
+
+cimport cython
+from cython.parallel cimport prange
+from libc.math cimport sin, cos, sqrt, atan2, fmod, M_PI
+
+cdef double WGS84_A = 6378137.0
+cdef double WGS84_F = 1.0 / 298.257223563
+cdef double WGS84_E_SQ = WGS84_F * (2.0 - WGS84_F)
+cdef double ONE_MINUS_E_SQ = 1.0 - WGS84_E_SQ
+cdef double DEG2RAD = M_PI / 180.0
+cdef double RAD2DEG = 180.0 / M_PI
+
+
+cpdef tuple lla_to_ecef_scalar(double lat, double lon, double alt):
+    """Scalar LLA to ECEF; mirrors coordinates._lla_to_ecef_scalar."""
+    cdef double lat_rad = lat * DEG2RAD
+    cdef double lon_rad = lon * DEG2RAD
+    cdef double sl = sin(lat_rad)
+    cdef double cl = cos(lat_rad)
+    cdef double slon = sin(lon_rad)
+    cdef double clon = cos(lon_rad)
+    cdef double N = WGS84_A / sqrt(1.0 - WGS84_E_SQ * sl * sl)
+    cdef double Nh = N + alt
+    return Nh * cl * clon, Nh * cl * slon, (ONE_MINUS_E_SQ * N + alt) * sl
+
+
+cpdef tuple get_az_alt_core(double ux, double uy, double uz,
+                            double sin_lat, double cos_lat,
+                            double sin_lon, double cos_lon,
+                            double ax, double ay, double az):
+    """Scalar az/alt kernel; mirrors coordinates._get_az_alt_core."""
+    cdef double dx = ax - ux
+    cdef double dy = ay - uy
+    cdef double dz = az - uz
+
+    cdef double east = -sin_lon * dx + cos_lon * dy
+    cdef double north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
+    cdef double up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+
+    cdef double altitude_deg = atan2(up, sqrt(east * east + north * north)) * RAD2DEG
+    cdef double azimuth_deg = fmod(atan2(east, north) * RAD2DEG + 360.0, 360.0)
+    return azimuth_deg, altitude_deg
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def lla_to_ecef_batch(double[::1] lat, double[::1] lon, double[::1] alt,
+                      double[:, ::1] out):
+    """Batched LLA to ECEF writing into a preallocated (N, 3) buffer."""
+    cdef Py_ssize_t i, n = lat.shape[0]
+    cdef double lat_rad, lon_rad, sl, cl, slon, clon, N, Nh
+    for i in prange(n, nogil=True, schedule='static'):
+        lat_rad = lat[i] * DEG2RAD
+        lon_rad = lon[i] * DEG2RAD
+        sl = sin(lat_rad)
+        cl = cos(lat_rad)
+        slon = sin(lon_rad)
+        clon = cos(lon_rad)
+        N = WGS84_A / sqrt(1.0 - WGS84_E_SQ * sl * sl)
+        Nh = N + alt[i]
+        out[i, 0] = Nh * cl * clon
+        out[i, 1] = Nh * cl * slon
+        out[i, 2] = (ONE_MINUS_E_SQ * N + alt[i]) * sl
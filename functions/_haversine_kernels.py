@@ -0,0 +1,39 @@
+"""Fused haversine ufunc for the buffered-error sweep.
+
+The NumPy pipeline in ``data_parser.haversine_distance`` allocates a
+temporary per arithmetic step; this ufunc fuses the whole formula into
+one pass per output element, which matters at the small array sizes the
+GUI's prediction sweep produces.
+"""
+
+import math
+
+from .data_parser import EARTH_RADIUS_M, haversine_distance
+
+try:
+    from numba import vectorize
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    @vectorize(['float64(float64, float64, float64, float64)'],
+               fastmath=True, cache=True)
+    def hav(lat1, lon1, lat2, lon2):
+        """Great-circle distance in metres, broadcast like a ufunc."""
+        lat1 = math.radians(lat1)
+        lat2 = math.radians(lat2)
+        dlat = lat2 - lat1
+        dlon = math.radians(lon2 - lon1)
+        a = (math.sin(dlat / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
+        return EARTH_RADIUS_M * 2 * math.asin(math.sqrt(a))
+
+    # Warm the kernel at import so the first sweep hits the on-disk
+    # cache instead of compiling mid-track
+    hav(0.0, 0.0, 0.0, 0.0)
+else:
+    def hav(lat1, lon1, lat2, lon2):
+        """NumPy fallback when Numba is unavailable."""
+        return haversine_distance(lat1, lon1, lat2, lon2)
@@ -1,48 +1,53 @@
 """Configuration loader for home position and other settings."""
 
+from pathlib import Path
+
+_REQUIRED_KEYS = ('home_lat', 'home_lon', 'home_alt')
+
+
 def load_config(config_path='data/config.txt'):
     """
     Load configuration from file.
-    
+
     Expected format:
         home_lat=<latitude>
         home_lon=<longitude>
         home_alt=<altitude>
-    
+
     Returns:
         dict: Configuration dictionary with home_lat, home_lon, home_alt
-        
+
     Raises:
         ValueError: If required configuration values are missing
     """
-    config = {}
-    
     try:
-        with open(config_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Only parse home position values
-                    if key in ['home_lat', 'home_lon', 'home_alt']:
-                        try:
-                            config[key] = float(value)
-                        except ValueError:
-                            raise ValueError(f"Invalid value for {key}: {value} (expected a number)")
+        text = Path(config_path).read_text()
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    except ValueError:
-        raise
-    
+
+    # One read, one split pass; comments and blank lines fall out of the
+    # comprehension filter
+    raw = {
+        key.strip(): value
+        for key, _, value in (
+            line.partition('=')
+            for line in map(str.strip, text.splitlines())
+            if line and not line.startswith('#') and '=' in line
+        )
+    }
+
+    config = {}
+    for key in _REQUIRED_KEYS:
+        if key in raw:
+            value = raw[key].strip()
+            try:
+                config[key] = float(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for {key}: {value} (expected a number)")
+
     # Validate required fields
-    required = ['home_lat', 'home_lon', 'home_alt']
-    missing = [key for key in required if key not in config]
+    missing = [key for key in _REQUIRED_KEYS if key not in config]
     if missing:
         raise ValueError(f"Missing required configuration: {', '.join(missing)}")
-    
+
     return config
@@ -1,82 +1,479 @@
 """Coordinate transformation utilities for LLA to ECEF and azimuth/altitude calculations."""
 
+from math import sin, cos, sqrt, asin, acos, atan2, pi
+
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python.
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
 # WGS84 Ellipsoid parameters
 WGS84_A = 6378137.0                    # Semi-major axis (meters)
 WGS84_F = 1 / 298.257223563            # Flattening
 WGS84_E_SQ = WGS84_F * (2 - WGS84_F)   # Square of first eccentricity
+_WGS84_ONE_MINUS_E_SQ = 1.0 - WGS84_E_SQ
+
+# Olson (1996) closed-form constants, derived once from the ellipsoid
+_OLSON_A1 = WGS84_A * WGS84_E_SQ
+_OLSON_A2 = _OLSON_A1 * _OLSON_A1
+_OLSON_A3 = _OLSON_A1 * WGS84_E_SQ / 2.0
+_OLSON_A4 = 2.5 * _OLSON_A2
+_OLSON_A5 = _OLSON_A1 + _OLSON_A3
+
+# Degree/radian conversion factors; a bare multiply skips the ufunc (and
+# even the math-module call) on scalar hot paths
+_DEG2RAD = pi / 180.0
+_RAD2DEG = 180.0 / pi
+
+
+def _lla_to_ecef_scalar(lat, lon, alt):
+    """
+    Scalar LLA to ECEF conversion using pure math-module operations.
+
+    Avoids NumPy ufunc dispatch and ndarray allocation, which dominate the
+    cost when converting a single point per call.
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        alt: Altitude in meters above ellipsoid
+
+    Returns:
+        tuple: (X, Y, Z) ECEF coordinates in meters as floats
+    """
+    lat_rad = lat * _DEG2RAD
+    lon_rad = lon * _DEG2RAD
+
+    # Compute each sin/cos exactly once and share across X, Y, Z
+    sl = sin(lat_rad)
+    cl = cos(lat_rad)
+    slon = sin(lon_rad)
+    clon = cos(lon_rad)
 
+    N = WGS84_A / sqrt(1 - WGS84_E_SQ * sl * sl)
+    Nh = N + alt
 
-def lla_to_ecef(lat, lon, alt):
+    return Nh * cl * clon, Nh * cl * slon, (_WGS84_ONE_MINUS_E_SQ * N + alt) * sl
+
+
+def _lla_to_ecef_vec(lat, lon, alt):
+    """
+    Vectorized LLA to ECEF conversion for ndarray inputs.
+
+    Accepts arrays of shape (N,) and converts the whole batch through a
+    single ufunc pipeline, so per-call Python overhead is O(1) in N.
+
+    Args:
+        lat: Latitude in degrees (ndarray of shape (N,), or scalar)
+        lon: Longitude in degrees (same shape as lat)
+        alt: Altitude in meters above ellipsoid (same shape as lat)
+
+    Returns:
+        np.ndarray: ECEF coordinates of shape (N, 3), or (3,) for scalars
+    """
+    lat_rad = np.radians(np.asarray(lat, dtype=np.float64))
+    lon_rad = np.radians(np.asarray(lon, dtype=np.float64))
+
+    sl = np.sin(lat_rad)
+    cl = np.cos(lat_rad)
+    slon = np.sin(lon_rad)
+    clon = np.cos(lon_rad)
+
+    N = WGS84_A / np.sqrt(1 - WGS84_E_SQ * sl * sl)
+    Nh = N + alt
+
+    X = Nh * cl * clon
+    Y = Nh * cl * slon
+    Z = (_WGS84_ONE_MINUS_E_SQ * N + alt) * sl
+
+    return np.stack([X, Y, Z], axis=-1)
+
+
+def lla_to_ecef(lat, lon, alt, out=None):
     """
     Convert LLA (Latitude, Longitude, Altitude) to ECEF (Earth-Centered, Earth-Fixed) coordinates.
-    
+
+    Scalar inputs take a math-module fast path and return a plain tuple;
+    ndarray inputs go through the vectorized NumPy path.
+
     Args:
         lat: Latitude in degrees
         lon: Longitude in degrees
         alt: Altitude in meters above ellipsoid
-        
+        out: Optional preallocated output array of shape (3,) (or (N, 3)
+             for batched input); written in place and returned, letting
+             per-tick callers reuse one buffer instead of allocating
+
     Returns:
-        np.ndarray: ECEF coordinates [X, Y, Z] in meters
+        tuple or np.ndarray: ECEF coordinates (X, Y, Z) in meters
     """
-    lat_rad = np.radians(lat)
-    lon_rad = np.radians(lon)
-    
-    N = WGS84_A / np.sqrt(1 - WGS84_E_SQ * np.sin(lat_rad)**2)
-    
-    X = (N + alt) * np.cos(lat_rad) * np.cos(lon_rad)
-    Y = (N + alt) * np.cos(lat_rad) * np.sin(lon_rad)
-    Z = ((1 - WGS84_E_SQ) * N + alt) * np.sin(lat_rad)
-    
-    return np.array([X, Y, Z])
+    if isinstance(lat, np.ndarray):
+        result = _lla_to_ecef_vec(lat, lon, alt)
+        if out is not None:
+            out[...] = result
+            return out
+        return result
+
+    X, Y, Z = _lla_to_ecef_scalar(lat, lon, alt)
+    if out is not None:
+        out[0] = X
+        out[1] = Y
+        out[2] = Z
+        return out
+    return X, Y, Z
+
+
+# Explicit signatures compile the kernels eagerly at import time instead
+# of paying type inference on the first tracking frame.
+@njit('UniTuple(f8, 3)(f8, f8, f8)', cache=True, fastmath=True)
+def ecef_to_lla(x, y, z):
+    """
+    Convert ECEF coordinates (meters) to LLA via Olson's (1996) closed form.
+
+    Non-iterative — roughly half the flops of the usual iterative
+    solutions, with no convergence branch — and accurate to well under a
+    millimeter for any aircraft altitude. The hot az/alt path goes
+    LLA->ECEF->ENU and never needs this; it exists for display-side
+    back-conversions.
+
+    Args:
+        x, y, z: ECEF coordinates in meters
+
+    Returns:
+        tuple: (latitude_deg, longitude_deg, altitude_m)
+    """
+    zp = abs(z)
+    w2 = x * x + y * y
+    w = sqrt(w2)
+    r2 = w2 + z * z
+    r = sqrt(r2)
+    lon_rad = atan2(y, x)
+
+    s2 = z * z / r2
+    c2 = w2 / r2
+    u = _OLSON_A2 / r
+    v = _OLSON_A3 - _OLSON_A4 / r
+    if c2 > 0.3:
+        # Low/mid latitudes: solve for sin(lat)
+        sl = (zp / r) * (1.0 + c2 * (_OLSON_A1 + u + s2 * v) / r)
+        lat_rad = asin(sl)
+        ss = sl * sl
+        cl = sqrt(1.0 - ss)
+    else:
+        # Near the poles: solve for cos(lat) to keep precision
+        cl = (w / r) * (1.0 - s2 * (_OLSON_A5 - u - c2 * v) / r)
+        lat_rad = acos(cl)
+        ss = 1.0 - cl * cl
+        sl = sqrt(ss)
+
+    g = 1.0 - WGS84_E_SQ * ss
+    rg = WGS84_A / sqrt(g)
+    rf = _WGS84_ONE_MINUS_E_SQ * rg
+    u = w - rg * cl
+    v = zp - rf * sl
+    f = cl * u + sl * v
+    m = cl * v - sl * u
+    p = m / (rf / g + f)
+    lat_rad += p
+    alt = f + m * p * 0.5
+    if z < 0.0:
+        lat_rad = -lat_rad
+    return lat_rad * _RAD2DEG, lon_rad * _RAD2DEG, alt
+
+
+@njit('UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)',
+      cache=True, fastmath=True)
+def _get_az_alt_core(ux, uy, uz, sin_lat, cos_lat, sin_lon, cos_lon, ax, ay, az):
+    """
+    Scalar az/alt kernel operating on unpacked floats.
+
+    Kept free of NumPy calls so Numba can compile it to straight-line
+    native code; without Numba it still runs as fast plain Python.
+    """
+    dx = ax - ux
+    dy = ay - uy
+    dz = az - uz
+
+    east = -sin_lon * dx + cos_lon * dy
+    north = -sin_lat * cos_lon * dx - sin_lat * sin_lon * dy + cos_lat * dz
+    up = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+
+    # atan2 against the horizontal magnitude avoids the 3D norm and is
+    # numerically better than asin near the zenith.
+    altitude_deg = atan2(up, sqrt(east * east + north * north)) * _RAD2DEG
+    # Float % with a positive divisor is already non-negative, so no +360
+    azimuth_deg = (atan2(east, north) * _RAD2DEG) % 360.0
+
+    return azimuth_deg, altitude_deg
+
+
+# Prefer the AOT-compiled Cython kernels when the optional extension has
+# been built (see _coord_c.pyx); they have no JIT cold start and no
+# Numba runtime dependency.
+try:
+    from ._coord_c import (lla_to_ecef_scalar as _lla_to_ecef_scalar,
+                           get_az_alt_core as _get_az_alt_core)
+except ImportError:
+    pass
+
+
+class Observer:
+    """
+    Fixed observer position with precomputed ECEF and ENU rotation.
+
+    The observer is stationary across thousands of aircraft updates, so the
+    sin/cos of its latitude/longitude and the 3x3 ECEF-to-ENU rotation
+    matrix are computed once here instead of on every get_az_alt call.
+    """
+
+    __slots__ = ('ecef', 'R', 'lat_rad', 'lon_rad', '_RT',
+                 '_sin_lat', '_cos_lat', '_sin_lon', '_cos_lon')
+
+    def __init__(self, lat, lon, alt):
+        """
+        Args:
+            lat: Observer latitude in degrees
+            lon: Observer longitude in degrees
+            alt: Observer altitude in meters above ellipsoid
+        """
+        lat_rad = lat * _DEG2RAD
+        lon_rad = lon * _DEG2RAD
+        sl = sin(lat_rad)
+        cl = cos(lat_rad)
+        slon = sin(lon_rad)
+        clon = cos(lon_rad)
+
+        self.lat_rad = lat_rad
+        self.lon_rad = lon_rad
+
+        self._sin_lat = sl
+        self._cos_lat = cl
+        self._sin_lon = slon
+        self._cos_lon = clon
+
+        self.ecef = np.array(_lla_to_ecef_scalar(lat, lon, alt))
+        # Rows map an ECEF difference vector onto (east, north, up)
+        self.R = np.array([
+            [-slon, clon, 0.0],
+            [-sl * clon, -sl * slon, cl],
+            [cl * clon, cl * slon, sl],
+        ])
+        # C-contiguous transpose so the batched (N,3) @ (3,3) matmul hits
+        # the fast gemm path without a per-call transpose view
+        self._RT = np.ascontiguousarray(self.R.T)
+
+    def az_alt(self, ac_ecef):
+        """
+        Azimuth/altitude of an aircraft ECEF position from this observer.
+
+        Args:
+            ac_ecef: Aircraft position in ECEF coordinates (tuple or np.ndarray)
+
+        Returns:
+            tuple: (azimuth_deg, altitude_deg), same conventions as get_az_alt
+        """
+        return _get_az_alt_core(
+            self.ecef[0], self.ecef[1], self.ecef[2],
+            self._sin_lat, self._cos_lat,
+            self._sin_lon, self._cos_lon,
+            ac_ecef[0], ac_ecef[1], ac_ecef[2],
+        )
+
+
+@njit('void(f8[:, ::1], f8[:, ::1], f8[::1], f8[::1])',
+      parallel=True, fastmath=True, cache=True)
+def _az_alt_batch_core(diff, R, az_out, alt_out):
+    """
+    Fused ENU rotation + az/alt conversion over an (N,3) difference block.
+
+    One pass per aircraft with no temporaries; prange spreads rows across
+    cores when Numba is available.
+    """
+    for i in prange(diff.shape[0]):
+        east = R[0, 0] * diff[i, 0] + R[0, 1] * diff[i, 1]
+        north = R[1, 0] * diff[i, 0] + R[1, 1] * diff[i, 1] + R[1, 2] * diff[i, 2]
+        up = R[2, 0] * diff[i, 0] + R[2, 1] * diff[i, 1] + R[2, 2] * diff[i, 2]
+
+        alt_out[i] = atan2(up, sqrt(east * east + north * north)) * _RAD2DEG
+        az_out[i] = (atan2(east, north) * _RAD2DEG) % 360.0
+
+
+def get_az_alt_batch(observer, ac_ecef, out=None):
+    """
+    Calculate azimuth and altitude for a batch of aircraft at once.
+
+    Computes the ENU projection for all aircraft with one matmul against
+    the observer's cached rotation matrix, amortizing NumPy dispatch over
+    the whole batch instead of paying it per aircraft. With Numba
+    installed, a fused parallel kernel handles the whole batch in one
+    pass without temporaries.
+
+    Args:
+        observer: Observer instance for the fixed ground station
+        ac_ecef: Aircraft positions in ECEF coordinates, shape (N, 3)
+        out: Optional (az_out, alt_out) pair of (N,) float64 arrays to
+             reuse across frames instead of allocating new results
+
+    Returns:
+        tuple: (azimuth_deg, altitude_deg) as two (N,) ndarrays, same
+               angle conventions as get_az_alt
+    """
+    diff = np.asarray(ac_ecef, dtype=np.float64) - observer.ecef
+
+    if out is None:
+        azimuth_deg = np.empty(diff.shape[0])
+        altitude_deg = np.empty(diff.shape[0])
+    else:
+        azimuth_deg, altitude_deg = out
+
+    if _HAVE_NUMBA:
+        _az_alt_batch_core(np.ascontiguousarray(diff), observer.R,
+                           azimuth_deg, altitude_deg)
+        return azimuth_deg, altitude_deg
+
+    enu = diff @ observer._RT
+
+    east = enu[..., 0]
+    north = enu[..., 1]
+    up = enu[..., 2]
+
+    np.mod(np.degrees(np.arctan2(east, north)), 360.0, out=azimuth_deg)
+    np.degrees(np.arctan2(up, np.hypot(east, north)), out=altitude_deg)
+
+    return azimuth_deg, altitude_deg
 
 
 def get_az_alt(user_ecef, user_lat_rad, user_lon_rad, ac_ecef):
     """
     Calculate azimuth and altitude from observer position to aircraft.
-    
+
     This function uses pre-calculated ECEF coordinates and trigonometric values
     to efficiently compute the target's position in the observer's local ENU frame.
-    
+
     Args:
-        user_ecef: Observer position in ECEF coordinates (np.ndarray)
+        user_ecef: Observer position in ECEF coordinates (tuple or np.ndarray)
         user_lat_rad: Observer latitude in radians
         user_lon_rad: Observer longitude in radians
-        ac_ecef: Aircraft position in ECEF coordinates (np.ndarray)
-        
+        ac_ecef: Aircraft position in ECEF coordinates (tuple or np.ndarray)
+
     Returns:
         tuple: (azimuth_deg, altitude_deg) where:
                - azimuth is in degrees [0, 360) with 0=North, clockwise
                - altitude is in degrees [-90, 90] with 0=horizon, +90=zenith
     """
-    # Get vector from observer to aircraft in ECEF frame
-    vec_ecef = ac_ecef - user_ecef
-    
-    # Rotate into observer's local ENU (East, North, Up) frame
-    sin_lon = np.sin(user_lon_rad)
-    cos_lon = np.cos(user_lon_rad)
-    sin_lat = np.sin(user_lat_rad)
-    cos_lat = np.cos(user_lat_rad)
-    
-    east = -sin_lon * vec_ecef[0] + cos_lon * vec_ecef[1]
-    north = -sin_lat * cos_lon * vec_ecef[0] - sin_lat * sin_lon * vec_ecef[1] + cos_lat * vec_ecef[2]
-    up = cos_lat * cos_lon * vec_ecef[0] + cos_lat * sin_lon * vec_ecef[1] + sin_lat * vec_ecef[2]
-    
-    # Convert ENU to azimuth and altitude
-    altitude_rad = np.arcsin(up / np.linalg.norm([east, north, up]))
-    azimuth_rad = np.arctan2(east, north)
-    
-    altitude_deg = np.degrees(altitude_rad)
-    azimuth_deg = (np.degrees(azimuth_rad) + 360) % 360  # Normalize to [0, 360)
-    
-    return azimuth_deg, altitude_deg
+    return _get_az_alt_core(
+        user_ecef[0], user_ecef[1], user_ecef[2],
+        sin(user_lat_rad), cos(user_lat_rad),
+        sin(user_lon_rad), cos(user_lon_rad),
+        ac_ecef[0], ac_ecef[1], ac_ecef[2],
+    )
+
+
+# Unit conversion constants for dead reckoning
+_KT_TO_MPS = 0.514444            # knots to m/s
+_FPM_TO_MPS = 0.3048 / 60.0      # feet/minute to m/s
+
+
+@njit('UniTuple(f8, 2)(f8)', cache=True, fastmath=True)
+def _meters_per_deg(lat_rad):
+    """
+    WGS84 meters per degree of latitude and longitude at a given latitude.
+
+    Uses the meridional (M) and prime-vertical (N) radii of curvature
+    instead of the flat 111320 m/deg approximation, which is ~0.5% off at
+    mid latitudes and ignores eccentricity in the longitude term.
+
+    Returns:
+        tuple: (meters_per_deg_lat, meters_per_deg_lon)
+    """
+    sl = sin(lat_rad)
+    denom = 1.0 - WGS84_E_SQ * sl * sl
+    M = WGS84_A * _WGS84_ONE_MINUS_E_SQ / (denom * sqrt(denom))
+    N = WGS84_A / sqrt(denom)
+    return M * _DEG2RAD, N * cos(lat_rad) * _DEG2RAD
 
 
-def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm, dt_seconds):
+@njit('UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8, f8)', cache=True, fastmath=True)
+def _get_future_position_scalar(lat, lon, alt_m, track_deg, speed_kts,
+                                vert_rate_fpm, dt_seconds):
+    """
+    Scalar dead-reckoning kernel using math-module trig only.
+
+    Compiles to a straight-line native routine under Numba; without it
+    the math-module calls still skip NumPy ufunc dispatch.
+    """
+    # Two compares cover the "current frame" (dt <= 0) and stationary
+    # aircraft cases before any trig runs
+    if dt_seconds <= 0.0 or (speed_kts == 0.0 and vert_rate_fpm == 0.0):
+        return lat, lon, alt_m
+
+    distance_m = speed_kts * _KT_TO_MPS * dt_seconds
+    track_rad = track_deg * _DEG2RAD
+
+    delta_north = distance_m * cos(track_rad)
+    delta_east = distance_m * sin(track_rad)
+
+    mper_lat, mper_lon = _meters_per_deg(lat * _DEG2RAD)
+
+    future_lat = lat + delta_north / mper_lat
+    future_lon = lon + delta_east / mper_lon
+    future_alt_m = alt_m + vert_rate_fpm * _FPM_TO_MPS * dt_seconds
+
+    return future_lat, future_lon, future_alt_m
+
+
+def _get_future_position_vec(lat, lon, alt_m, track_deg, speed_kts,
+                             vert_rate_fpm, dt_seconds):
+    """
+    Vectorized dead reckoning over arrays of aircraft states.
+
+    dt_seconds may be a scalar or an array broadcastable against the
+    state arrays; non-positive entries return the current position.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    dt = np.asarray(dt_seconds, dtype=np.float64)
+
+    distance_m = speed_kts * _KT_TO_MPS * dt
+    track_rad = np.radians(track_deg)
+
+    delta_north = distance_m * np.cos(track_rad)
+    delta_east = distance_m * np.sin(track_rad)
+
+    lat_rad = np.radians(lat)
+    sl = np.sin(lat_rad)
+    denom = 1.0 - WGS84_E_SQ * sl * sl
+    mper_lat = WGS84_A * _WGS84_ONE_MINUS_E_SQ / (denom * np.sqrt(denom)) * _DEG2RAD
+    mper_lon = WGS84_A / np.sqrt(denom) * np.cos(lat_rad) * _DEG2RAD
+
+    future_lat = lat + delta_north / mper_lat
+    future_lon = lon + delta_east / mper_lon
+    future_alt_m = alt_m + vert_rate_fpm * _FPM_TO_MPS * dt
+
+    predicting = dt > 0
+    future_lat = np.where(predicting, future_lat, lat)
+    future_lon = np.where(predicting, future_lon, lon)
+    future_alt_m = np.where(predicting, future_alt_m, alt_m)
+
+    return future_lat, future_lon, future_alt_m
+
+
+def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm,
+                        dt_seconds):
     """
     Predict future position of aircraft based on current state.
-    
+
     Args:
         lat: Current latitude (degrees)
         lon: Current longitude (degrees)
@@ -85,33 +482,13 @@ def get_future_position(lat, lon, alt_m, track_deg, speed_kts, vert_rate_fpm, dt
         speed_kts: Ground speed (knots)
         vert_rate_fpm: Vertical rate (feet per minute)
         dt_seconds: Time delta for prediction (seconds)
-        
+
     Returns:
-        tuple: (future_lat, future_lon, future_alt_m) predicted position
+        tuple: (future_lat, future_lon, future_alt_m) predicted position;
+               three ndarrays when the inputs are arrays
     """
-    if dt_seconds <= 0:
-        return lat, lon, alt_m
-    
-    # Convert units
-    speed_mps = speed_kts * 0.514444  # knots to m/s
-    vert_rate_mps = vert_rate_fpm * 0.3048 / 60.0  # fpm to m/s
-    
-    # Calculate distance traveled
-    distance_m = speed_mps * dt_seconds
-    
-    # Convert track to radians
-    track_rad = np.radians(track_deg)
-    
-    # Displacement in North/East directions
-    delta_north = distance_m * np.cos(track_rad)
-    delta_east = distance_m * np.sin(track_rad)
-    
-    # Convert to lat/lon change
-    meters_per_deg_lat = 111320.0
-    meters_per_deg_lon = 111320.0 * np.cos(np.radians(lat))
-    
-    future_lat = lat + (delta_north / meters_per_deg_lat)
-    future_lon = lon + (delta_east / meters_per_deg_lon)
-    future_alt_m = alt_m + (vert_rate_mps * dt_seconds)
-    
-    return future_lat, future_lon, future_alt_m
+    if isinstance(lat, np.ndarray) or isinstance(dt_seconds, np.ndarray):
+        return _get_future_position_vec(lat, lon, alt_m, track_deg,
+                                        speed_kts, vert_rate_fpm, dt_seconds)
+    return _get_future_position_scalar(lat, lon, alt_m, track_deg,
+                                       speed_kts, vert_rate_fpm, dt_seconds)
@@ -1,46 +1,201 @@
 """Data parsing and utility functions."""
 
+import math
 import re
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional; without it the kernels run as plain Python.
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+EARTH_RADIUS_M = 6371000
+
+
+@njit(cache=True, fastmath=True)
+def _haversine_scalar(lat1, lon1, lat2, lon2):
+    """Scalar haversine kernel; math-module calls lower to libm under Numba."""
+    lat1r = math.radians(lat1)
+    lat2r = math.radians(lat2)
+    dlat = lat2r - lat1r
+    dlon = math.radians(lon2 - lon1)
+    a = (math.sin(dlat * 0.5) ** 2
+         + math.cos(lat1r) * math.cos(lat2r) * math.sin(dlon * 0.5) ** 2)
+    return 2.0 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _haversine_batch(lat1, lon1, lat2, lon2, out):
+    """Parallel elementwise haversine over equal-length coordinate arrays."""
+    for i in prange(lat1.shape[0]):
+        out[i] = _haversine_scalar(lat1[i], lon1[i], lat2[i], lon2[i])
+
+
+if _HAVE_NUMBA:
+    # Warm the scalar kernel at import so the first real call hits the
+    # on-disk cache instead of paying compilation mid-track
+    _haversine_scalar(0.0, 0.0, 0.0, 0.0)
+
 
 def haversine_distance(lat1, lon1, lat2, lon2):
     """
     Calculate the great circle distance between two points on Earth.
-    
+
     Args:
         lat1, lon1: First point (decimal degrees)
         lat2, lon2: Second point (decimal degrees)
-        
+
     Returns:
         float: Distance in meters
     """
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    
+    # Scalar pairs (the common case from position matching) go through the
+    # math module, which skips NumPy's per-call ufunc dispatch entirely
+    if (isinstance(lat1, (int, float)) and isinstance(lon1, (int, float))
+            and isinstance(lat2, (int, float)) and isinstance(lon2, (int, float))):
+        return _haversine_scalar(lat1, lon1, lat2, lon2)
+
+    # Array path: convert once, then reuse the difference buffers in place
+    # so the whole batch makes a single pass through memory instead of
+    # allocating a fresh temporary per ufunc
+    if _HAVE_NUMBA:
+        lat1 = np.ascontiguousarray(lat1, dtype=np.float64)
+        lon1 = np.ascontiguousarray(lon1, dtype=np.float64)
+        lat2 = np.ascontiguousarray(lat2, dtype=np.float64)
+        lon2 = np.ascontiguousarray(lon2, dtype=np.float64)
+        lat1, lon1, lat2, lon2 = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+        out = np.empty(lat1.shape, dtype=np.float64)
+        _haversine_batch(lat1.ravel(), lon1.ravel(), lat2.ravel(),
+                         lon2.ravel(), out.ravel())
+        return out
+
+    lat1 = np.deg2rad(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.deg2rad(np.asarray(lon1, dtype=np.float64))
+    lat2 = np.deg2rad(np.asarray(lat2, dtype=np.float64))
+    lon2 = np.deg2rad(np.asarray(lon2, dtype=np.float64))
+
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
-    c = 2 * np.arcsin(np.sqrt(a))
-    
-    earth_radius_m = 6371000
-    return c * earth_radius_m
+
+    dlat *= 0.5
+    a = np.sin(dlat, out=dlat)
+    np.multiply(a, a, out=a)
+
+    dlon *= 0.5
+    sdlon = np.sin(dlon, out=dlon)
+    np.multiply(sdlon, sdlon, out=sdlon)
+
+    tmp = np.cos(lat1)
+    tmp *= np.cos(lat2)
+    tmp *= sdlon
+    a += tmp
+
+    np.sqrt(a, out=a)
+    np.arcsin(a, out=a)
+    a *= 2 * EARTH_RADIUS_M
+    return a
+
+
+def ecef_distance(a_ecef, b_ecef):
+    """
+    Straight-line (chord) distance between two ECEF points, in meters.
+
+    When both endpoints are already in ECEF (e.g. converted once via
+    lla_to_ecef), the chord costs three subtractions, three multiplies
+    and a sqrt versus haversine's four trig calls, and at sub-kilometer
+    separations it differs from the great-circle arc by well under
+    0.001%.
+
+    Args:
+        a_ecef, b_ecef: (X, Y, Z) sequences in meters
+
+    Returns:
+        float: Distance in meters
+    """
+    dx = a_ecef[0] - b_ecef[0]
+    dy = a_ecef[1] - b_ecef[1]
+    dz = a_ecef[2] - b_ecef[2]
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+# Compiled once; only the fallback paths below still need the regex.
+# The fraction is a non-optional group rather than \.?\d* so the pattern
+# can never match a bare "3." or degrade on dot-heavy input.
+_FLOAT_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def haversine_one_to_many(lat0_deg, lon0_deg, lats_deg, lons_deg):
+    """
+    Distances from one fixed point to many points, in meters.
+
+    For an observer-fixed query the reference point's trig is the same for
+    every candidate, so it is computed once here with the math module and
+    only the candidate arrays go through the vector expression. Roughly
+    halves the trig work versus calling haversine_distance with a
+    broadcast reference point.
+
+    Args:
+        lat0_deg, lon0_deg: Fixed reference point (decimal degrees)
+        lats_deg, lons_deg: Candidate points (decimal degrees, array-like)
+
+    Returns:
+        np.ndarray: Distances in meters, same shape as the candidate arrays
+    """
+    lat0 = math.radians(lat0_deg)
+    cl0 = math.cos(lat0)
+
+    lats = np.deg2rad(np.asarray(lats_deg, dtype=np.float64))
+    dlons = np.deg2rad(np.asarray(lons_deg, dtype=np.float64) - lon0_deg)
+
+    s = np.sin((lats - lat0) * 0.5)
+    np.multiply(s, s, out=s)
+
+    cs = np.cos(lats)
+    cs *= cl0
+    dlons *= 0.5
+    sd = np.sin(dlons, out=dlons)
+    np.multiply(sd, sd, out=sd)
+    cs *= sd
+    s += cs
+
+    np.sqrt(s, out=s)
+    np.arcsin(s, out=s)
+    s *= 2 * EARTH_RADIUS_M
+    return s
 
 
 def parse_position_string(position_str):
     """
     Extract latitude and longitude from a position string.
-    
+
     Expects format like: "45.123456 -122.654321"
-    
+
     Args:
         position_str: String containing position data
-        
+
     Returns:
         tuple: (latitude, longitude) or None if parsing fails
     """
-    pattern = r"(-?\d+\.?\d*)"
-    matches = re.findall(pattern, position_str)
-    
+    # The documented format is two whitespace-separated numbers; split +
+    # float is several times faster than running the regex engine
+    tokens = position_str.split()
+    if len(tokens) >= 2:
+        try:
+            return float(tokens[0]), float(tokens[1])
+        except ValueError:
+            pass
+
+    # Fallback for strings with extra punctuation or labels
+    matches = _FLOAT_RE.findall(position_str)
     if len(matches) >= 2:
         try:
             return float(matches[0]), float(matches[1])
@@ -52,14 +207,21 @@ def parse_position_string(position_str):
 def parse_float_value(text):
     """
     Extract first float value from text.
-    
+
     Args:
         text: Text containing a numeric value
-        
+
     Returns:
         float: Parsed value, or None if not found
     """
-    matches = re.findall(r"(-?\d+\.?\d*)", text)
+    # Clean numeric strings parse directly; the regex only runs for
+    # mixed text like "350 kts"
+    try:
+        return float(text.strip())
+    except ValueError:
+        pass
+
+    matches = _FLOAT_RE.findall(text)
     if matches:
         try:
             return float(matches[0])
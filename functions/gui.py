@@ -7,9 +7,17 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from collections import deque
 import threading
+import time
 
-from .data_parser import haversine_distance
+import numpy as np
 
+from ._haversine_kernels import hav
+
+
+# Bound once so the hot path pays a single C call; monotonic because
+# every timestamp here is relative (plot clock, prediction ages) and a
+# wall-clock jump must not expire or mature buffered predictions
+_mono = time.monotonic
 
 # Constants
 MAX_POINTS = 100
@@ -20,12 +28,104 @@ plot_data_lock = threading.Lock()
 prediction_lock = threading.Lock()
 
 # Data storage
-actual_positions = deque(maxlen=MAX_POINTS)
-predicted_positions = deque(maxlen=MAX_POINTS)
 prediction_errors = deque(maxlen=MAX_POINTS)
 error_timestamps = deque(maxlen=MAX_POINTS)
-timestamps = deque(maxlen=MAX_POINTS)
-prediction_buffer = {}
+
+# Trajectory history as preallocated parallel rings: one write index,
+# no per-sample tuples, and the plot reads array views instead of
+# rebuilding four lists per frame
+_act_lat = np.empty(MAX_POINTS)
+_act_lon = np.empty(MAX_POINTS)
+_pred_lat = np.empty(MAX_POINTS)
+_pred_lon = np.empty(MAX_POINTS)
+# Total samples ever written; the write slot and fill level both derive
+# from it. Single producer, single consumer: the producer fills the
+# slots first and bumps this last, and CPython int reads/writes are
+# atomic, so the GUI reads the ring without taking plot_data_lock.
+_path_head = 0
+
+
+_IDX = np.arange(MAX_POINTS)
+_idx_scratch = np.empty(MAX_POINTS, dtype=np.intp)
+
+
+def _ring_view(arr, head, out):
+    """Ring contents in insertion order for a snapshotted head.
+
+    Partial rings are contiguous and come back as a plain slice; full
+    rings unwrap through a wrapped take into the caller's scratch array,
+    so no frame allocates.
+    """
+    if head < MAX_POINTS:
+        return arr[:head]
+    np.add(_IDX, head, out=_idx_scratch)
+    return np.take(arr, _idx_scratch, mode='wrap', out=out)
+
+
+class _PredictionBuffer:
+    """
+    Pending predictions as a columnar ring buffer.
+
+    Four parallel float arrays instead of a dict of tuples, so maturity
+    checks and the batched error haversine run over contiguous memory
+    with no per-entry Python objects.
+    """
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.t = np.empty(capacity)
+        self.lat = np.empty(capacity)
+        self.lon = np.empty(capacity)
+        self.dt = np.empty(capacity)
+        self.head = 0  # next write slot
+        self.size = 0
+        # Earliest expected match time over all pending entries; lets
+        # callers skip classification entirely until something can
+        # mature, the same scan-avoidance a heap would buy without
+        # giving up the columnar layout
+        self.next_event = float('inf')
+
+    def __len__(self):
+        return self.size
+
+    def append(self, t, lat, lon, dt):
+        i = self.head
+        self.t[i] = t
+        self.lat[i] = lat
+        self.lon[i] = lon
+        self.dt[i] = dt
+        self.head = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.next_event = min(self.next_event, t + dt)
+
+    def arrays(self):
+        """Contents in insertion order (copies only when wrapped)."""
+        if self.size < self.capacity:
+            n = self.size
+            return self.t[:n], self.lat[:n], self.lon[:n], self.dt[:n]
+        h = self.head
+        return (np.concatenate((self.t[h:], self.t[:h])),
+                np.concatenate((self.lat[h:], self.lat[:h])),
+                np.concatenate((self.lon[h:], self.lon[:h])),
+                np.concatenate((self.dt[h:], self.dt[:h])))
+
+    def rebuild(self, t, lat, lon, dt):
+        """Reset contents to the given (already in-order) arrays."""
+        n = t.shape[0]
+        self.t[:n] = t
+        self.lat[:n] = lat
+        self.lon[:n] = lon
+        self.dt[:n] = dt
+        self.head = n % self.capacity
+        self.size = n
+        self.next_event = float((t + dt).min()) if n else float('inf')
+
+
+prediction_buffer = _PredictionBuffer()
+
+# Set by update_plot_data whenever new data lands; the GUI skips whole
+# redraw cycles while it stays clear
+_dirty = threading.Event()
 
 # Global state
 prediction_time = 0.0
@@ -34,6 +134,7 @@ current_error = 0.0
 current_actual = (0.0, 0.0)
 current_predicted = (0.0, 0.0)
 avg_error = 0.0
+_err_sum = 0.0  # running sum over prediction_errors for the O(1) mean
 
 
 def update_plot_data(actual_lat, actual_lon, predicted_lat, predicted_lon, pred_time_used):
@@ -45,50 +146,78 @@ def update_plot_data(actual_lat, actual_lon, predicted_lat, predicted_lon, pred_
         predicted_lat, predicted_lon: Predicted position
         pred_time_used: Prediction time offset in seconds
     """
-    global start_time, current_error, current_actual, current_predicted, avg_error, prediction_buffer
+    global start_time, current_error, current_actual, current_predicted, avg_error, prediction_buffer, _err_sum, _path_head
+    
+    now = _mono()
+    if start_time is None:
+        start_time = now
+    
+    current_time = now - start_time
+    absolute_time = now
+    
+    # Lock-free ring publish: slots first, counter last
+    i = _path_head % MAX_POINTS
+    _act_lat[i] = actual_lat
+    _act_lon[i] = actual_lon
+    _pred_lat[i] = predicted_lat
+    _pred_lon[i] = predicted_lon
+    _path_head += 1
+    
+    current_actual = (actual_lat, actual_lon)
+    current_predicted = (predicted_lat, predicted_lon)
     
     with plot_data_lock:
-        if start_time is None:
-            start_time = __import__('time').time()
-        
-        current_time = __import__('time').time() - start_time
-        absolute_time = __import__('time').time()
-        
-        # Store positions
-        actual_positions.append((actual_lat, actual_lon, current_time))
-        predicted_positions.append((predicted_lat, predicted_lon, current_time))
-        timestamps.append(current_time)
-        
-        current_actual = (actual_lat, actual_lon)
-        current_predicted = (predicted_lat, predicted_lon)
-        
         # Store prediction for future comparison
         if pred_time_used > 0:
-            prediction_buffer[absolute_time] = (predicted_lat, predicted_lon, pred_time_used)
-        
-        # Check past predictions against current actual position
-        predictions_to_remove = []
-        
-        for pred_timestamp, (pred_lat, pred_lon, pred_dt) in prediction_buffer.items():
-            age = absolute_time - pred_timestamp
-            time_diff = abs(age - pred_dt)
+            prediction_buffer.append(absolute_time, predicted_lat,
+                                     predicted_lon, pred_time_used)
+        
+        # Classify past predictions against the current actual position;
+        # only the snapshot and compaction happen here — the matured rows
+        # are copied out so the haversine runs after the lock is dropped
+        # and the GUI thread is never blocked on trig. The whole block is
+        # skipped while nothing can possibly have matured yet.
+        ready_lat = ready_lon = None
+        if (len(prediction_buffer) > 0
+                and absolute_time >= prediction_buffer.next_event - 0.75):
+            t, lat, lon, dt = prediction_buffer.arrays()
+            age = absolute_time - t
+            ready = np.abs(age - dt) < 0.75  # Within tolerance window
+            # Once the match window has closed the entry can never
+            # produce a hit, so it is evicted immediately instead of
+            # lingering for the extra grace seconds
+            expired = (age - dt > 0.75) | (age > BUFFER_MAX_AGE)
             
-            if time_diff < 0.75:  # Within tolerance window
-                error = haversine_distance(pred_lat, pred_lon, actual_lat, actual_lon)
-                prediction_errors.append(error)
-                error_timestamps.append(current_time)
-                current_error = error
-                predictions_to_remove.append(pred_timestamp)
-            elif age > pred_dt + 2:
-                predictions_to_remove.append(pred_timestamp)
-            elif age > BUFFER_MAX_AGE:
-                predictions_to_remove.append(pred_timestamp)
-        
-        for ts in predictions_to_remove:
-            del prediction_buffer[ts]
+            if ready.any():
+                # Fancy indexing copies, so these stay valid after the
+                # rebuild below and outside the lock
+                ready_lat = lat[ready]
+                ready_lon = lon[ready]
+            
+            keep = ~(ready | expired)
+            if not keep.all():
+                prediction_buffer.rebuild(t[keep], lat[keep],
+                                          lon[keep], dt[keep])
+    
+    if ready_lat is not None:
+        # The fused ufunc broadcasts the scalar actual position across
+        # the matured rows in a single pass, no temporaries
+        errors = np.atleast_1d(hav(ready_lat, ready_lon,
+                                   actual_lat, actual_lon))
         
-        if len(prediction_errors) > 0:
-            avg_error = sum(prediction_errors) / len(prediction_errors)
+        with plot_data_lock:
+            for error in errors:
+                # Maintain the sum as entries roll off the deque so
+                # the mean below never re-walks the window
+                if len(prediction_errors) == prediction_errors.maxlen:
+                    _err_sum -= prediction_errors[0]
+                prediction_errors.append(float(error))
+                error_timestamps.append(current_time)
+                _err_sum += float(error)
+            current_error = float(errors[-1])
+            avg_error = _err_sum / len(prediction_errors)
+    
+    _dirty.set()
 
 
 class PlotGUI:
@@ -99,6 +228,18 @@ class PlotGUI:
         self.root.title("ADS-B Delay Compensation & Tracking (Serial)")
         self.root.geometry("1000x750")
         
+        self._label_cache = {}
+        # Reusable frame buffers: ring-unwrap scratch for the four
+        # trajectory series and one-element arrays for the point
+        # markers, so set_data never converts fresh Python lists
+        self._sc_alat = np.empty(MAX_POINTS)
+        self._sc_alon = np.empty(MAX_POINTS)
+        self._sc_plat = np.empty(MAX_POINTS)
+        self._sc_plon = np.empty(MAX_POINTS)
+        self._pt_ax = np.empty(1)
+        self._pt_ay = np.empty(1)
+        self._pt_px = np.empty(1)
+        self._pt_py = np.empty(1)
         self._setup_controls()
         self._setup_info_panel()
         self._setup_plots()
@@ -191,10 +332,12 @@ class PlotGUI:
         self.ax_pos.set_ylabel("Latitude")
         self.ax_pos.grid(True, alpha=0.3)
         
-        self.actual_line, = self.ax_pos.plot([], [], 'b-', label='Actual', linewidth=1.5, alpha=0.7)
-        self.predicted_line, = self.ax_pos.plot([], [], 'r--', label='Predicted', linewidth=1.5, alpha=0.7)
-        self.actual_point, = self.ax_pos.plot([], [], 'bo', markersize=8)
-        self.predicted_point, = self.ax_pos.plot([], [], 'r^', markersize=8)
+        # animated=True keeps these artists out of the full-scene draw
+        # so they can be blitted over the cached backgrounds below
+        self.actual_line, = self.ax_pos.plot([], [], 'b-', label='Actual', linewidth=1.5, alpha=0.7, animated=True)
+        self.predicted_line, = self.ax_pos.plot([], [], 'r--', label='Predicted', linewidth=1.5, alpha=0.7, animated=True)
+        self.actual_point, = self.ax_pos.plot([], [], 'bo', markersize=8, animated=True)
+        self.predicted_point, = self.ax_pos.plot([], [], 'r^', markersize=8, animated=True)
         self.ax_pos.legend(loc='upper left')
         
         # Error plot
@@ -204,8 +347,8 @@ class PlotGUI:
         self.ax_err.set_ylabel("Error (m)")
         self.ax_err.grid(True, alpha=0.3)
         
-        self.err_line, = self.ax_err.plot([], [], 'r-', linewidth=2, label='Error')
-        self.avg_line, = self.ax_err.plot([], [], 'g--', linewidth=2, alpha=0.7, label='Average')
+        self.err_line, = self.ax_err.plot([], [], 'r-', linewidth=2, label='Error', animated=True)
+        self.avg_line, = self.ax_err.plot([], [], 'g--', linewidth=2, alpha=0.7, label='Average', animated=True)
         self.ax_err.legend(loc='upper right')
         self.ax_err.set_ylim(0, 100)
         
@@ -216,6 +359,12 @@ class PlotGUI:
         canvas_frame.pack(fill=tk.BOTH, expand=True)
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=canvas_frame)
+        # Per-axes backgrounds for blitting; recaptured on every full
+        # draw so window resizes stay correct
+        self._bg_pos = None
+        self._bg_err = None
+        self._lims = None
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -227,6 +376,11 @@ class PlotGUI:
         )
         explain_label.pack(pady=5)
     
+    def _on_draw(self, event):
+        """Snapshot the static scene after any full draw."""
+        self._bg_pos = self.canvas.copy_from_bbox(self.ax_pos.bbox)
+        self._bg_err = self.canvas.copy_from_bbox(self.ax_err.bbox)
+
     def on_slider_change(self, val):
         """Handle prediction time slider change."""
         global prediction_time
@@ -236,63 +390,114 @@ class PlotGUI:
     
     def update_plot(self):
         """Update plots with latest data."""
-        with plot_data_lock:
-            if len(actual_positions) > 0:
-                actual_lats = [p[0] for p in actual_positions]
-                actual_lons = [p[1] for p in actual_positions]
-                pred_lats = [p[0] for p in predicted_positions]
-                pred_lons = [p[1] for p in predicted_positions]
-                
-                self.actual_line.set_data(actual_lons, actual_lats)
-                self.predicted_line.set_data(pred_lons, pred_lats)
-                
-                if len(actual_positions) > 0:
-                    self.actual_point.set_data([actual_lons[-1]], [actual_lats[-1]])
-                    self.predicted_point.set_data([pred_lons[-1]], [pred_lats[-1]])
-                
-                if len(actual_lons) > 0:
-                    all_lons = actual_lons + pred_lons
-                    all_lats = actual_lats + pred_lats
-                    
-                    lon_margin = max(0.001, (max(all_lons) - min(all_lons)) * 0.1)
-                    lat_margin = max(0.001, (max(all_lats) - min(all_lats)) * 0.1)
-                    
-                    self.ax_pos.set_xlim(min(all_lons) - lon_margin, max(all_lons) + lon_margin)
-                    self.ax_pos.set_ylim(min(all_lats) - lat_margin, max(all_lats) + lat_margin)
+        # Debounce at the data rate: if nothing arrived since the last
+        # frame there is nothing to redraw or re-layout
+        if not _dirty.is_set():
+            self.root.after(200, self.update_plot)
+            return
+        _dirty.clear()
+        
+        # One atomic snapshot of the publish counter; every slot below
+        # it was written before the bump, so the position series read
+        # without blocking the tracking thread
+        h = _path_head
+        if h > 0:
+            actual_lats = _ring_view(_act_lat, h, self._sc_alat)
+            actual_lons = _ring_view(_act_lon, h, self._sc_alon)
+            pred_lats = _ring_view(_pred_lat, h, self._sc_plat)
+            pred_lons = _ring_view(_pred_lon, h, self._sc_plon)
+            
+            self.actual_line.set_data(actual_lons, actual_lats)
+            self.predicted_line.set_data(pred_lons, pred_lats)
+            
+            self._pt_ax[0] = actual_lons[-1]
+            self._pt_ay[0] = actual_lats[-1]
+            self._pt_px[0] = pred_lons[-1]
+            self._pt_py[0] = pred_lats[-1]
+            self.actual_point.set_data(self._pt_ax, self._pt_ay)
+            self.predicted_point.set_data(self._pt_px, self._pt_py)
+            
+            lon_lo = min(actual_lons.min(), pred_lons.min())
+            lon_hi = max(actual_lons.max(), pred_lons.max())
+            lat_lo = min(actual_lats.min(), pred_lats.min())
+            lat_hi = max(actual_lats.max(), pred_lats.max())
+            
+            lon_margin = max(0.001, (lon_hi - lon_lo) * 0.1)
+            lat_margin = max(0.001, (lat_hi - lat_lo) * 0.1)
+            
+            self.ax_pos.set_xlim(lon_lo - lon_margin, lon_hi + lon_margin)
+            self.ax_pos.set_ylim(lat_lo - lat_margin, lat_hi + lat_margin)
+            
+            # The error deques still mutate under plot_data_lock;
+            # hold it just long enough to copy them out
+            with plot_data_lock:
+                times_list = list(error_timestamps)
+                err_list = list(prediction_errors)
+            
+            if err_list:
+                self.err_line.set_data(times_list, err_list)
                 
-                if len(prediction_errors) > 0:
-                    times_list = list(error_timestamps)
-                    err_list = list(prediction_errors)
-                    
-                    self.err_line.set_data(times_list, err_list)
-                    
-                    if len(times_list) > 1:
-                        self.avg_line.set_data(
-                            [times_list[0], times_list[-1]], 
-                            [avg_error, avg_error]
-                        )
-                    
-                    if len(times_list) > 0:
-                        self.ax_err.set_xlim(max(0, times_list[-1] - 60), times_list[-1] + 5)
-                        max_err = max(err_list) if err_list else 100
-                        self.ax_err.set_ylim(0, max(50, max_err * 1.2))
+                if len(times_list) > 1:
+                    self.avg_line.set_data(
+                        [times_list[0], times_list[-1]], 
+                        [avg_error, avg_error]
+                    )
                 
-                self._update_labels()
-                self.canvas.draw_idle()
-        
-        self.root.after(200, self.update_plot)
+                if len(times_list) > 0:
+                    self.ax_err.set_xlim(max(0, times_list[-1] - 60), times_list[-1] + 5)
+                    max_err = max(err_list) if err_list else 100
+                    self.ax_err.set_ylim(0, max(50, max_err * 1.2))
+            
+            self._update_labels()
+            
+            # Blit the animated artists over the cached backgrounds;
+            # a full draw (which recaptures them via the draw_event
+            # hook) is only paid when the axis limits actually moved
+            lims = (self.ax_pos.get_xlim(), self.ax_pos.get_ylim(),
+                    self.ax_err.get_xlim(), self.ax_err.get_ylim())
+            if lims != self._lims or self._bg_pos is None:
+                self._lims = lims
+                self.canvas.draw()
+            
+            self.canvas.restore_region(self._bg_pos)
+            self.ax_pos.draw_artist(self.actual_line)
+            self.ax_pos.draw_artist(self.predicted_line)
+            self.ax_pos.draw_artist(self.actual_point)
+            self.ax_pos.draw_artist(self.predicted_point)
+            self.canvas.blit(self.ax_pos.bbox)
+            
+            self.canvas.restore_region(self._bg_err)
+            self.ax_err.draw_artist(self.err_line)
+            self.ax_err.draw_artist(self.avg_line)
+            self.canvas.blit(self.ax_err.bbox)
+        
+        # A frame was just drawn: hold off for 500 ms so redraws run at
+        # ~2 Hz even when data ingests faster — well under what the eye
+        # needs, and the dirty flag coalesces everything that arrived in
+        # between. Quiet ticks stay on the cheap 200 ms no-draw poll.
+        self.root.after(500, self.update_plot)
     
+    def _set_label(self, label, text):
+        """Push text to a label only when it actually changed.
+
+        Each .config() call goes through the Tcl bridge and schedules a
+        relayout, so identical text is filtered out here.
+        """
+        if self._label_cache.get(label) != text:
+            self._label_cache[label] = text
+            label.config(text=text)
+
     def _update_labels(self):
         """Update info labels."""
         if current_error > 0:
-            self.error_label.config(text=f"Prediction Error: {current_error:.1f} m")
+            self._set_label(self.error_label, f"Prediction Error: {current_error:.1f} m")
         else:
-            self.error_label.config(text="Prediction Error: waiting...")
+            self._set_label(self.error_label, "Prediction Error: waiting...")
         
-        self.avg_error_label.config(text=f"Avg Error: {avg_error:.1f} m")
-        self.buffer_label.config(text=f"Pending: {len(prediction_buffer)}")
-        self.actual_label.config(text=f"Lat: {current_actual[0]:.6f}, Lon: {current_actual[1]:.6f}")
-        self.predicted_label.config(text=f"Lat: {current_predicted[0]:.6f}, Lon: {current_predicted[1]:.6f}")
+        self._set_label(self.avg_error_label, f"Avg Error: {avg_error:.1f} m")
+        self._set_label(self.buffer_label, f"Pending: {len(prediction_buffer)}")
+        self._set_label(self.actual_label, f"Lat: {current_actual[0]:.6f}, Lon: {current_actual[1]:.6f}")
+        self._set_label(self.predicted_label, f"Lat: {current_predicted[0]:.6f}, Lon: {current_predicted[1]:.6f}")
     
     def run(self):
         """Run the GUI."""
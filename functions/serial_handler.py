@@ -1,9 +1,14 @@
 """Serial port communication handler for ESP32."""
 
+import queue
 import serial
 import time
 import threading
 
+# Wire format for pointing commands; bytes %-formatting never builds an
+# intermediate str or runs the UTF-8 encoder
+_AZALT_FMT = b"AZ:%.5f ALT:%.5f\n"
+
 
 class SerialHandler:
     """Manages serial communication with ESP32."""
@@ -23,6 +28,11 @@ class SerialHandler:
         self.ser = None
         self.connected = False
         self.lock = threading.Lock()
+        # Depth-1 command queue drained by a dedicated writer thread;
+        # the tracker only cares about the newest az/alt, so a stale
+        # queued command is evicted rather than the producer blocking
+        self._q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._writer, daemon=True).start()
     
     def connect(self):
         """
@@ -54,40 +64,68 @@ class SerialHandler:
                 self.connected = False
                 return False
     
-    def send(self, data):
+    def send_azalt(self, azimuth, altitude):
         """
-        Send data to ESP32.
+        Queue a pointing command, formatted straight to bytes.
         
         Args:
-            data: String data to send
+            azimuth, altitude: Pointing angles in degrees
             
         Returns:
-            bool: True if sent successfully, False otherwise
+            bool: True once the command is queued
+        """
+        return self.send(_AZALT_FMT % (azimuth, altitude))
+    
+    def send(self, data):
         """
-        print(f"---> {data}")
+        Queue data for the writer thread (non-blocking, latest wins).
         
-        # Try to connect if not already connected
-        if not self.connected:
-            if not self.connect():
-                print("Not connected to ESP32, skipping send.")
-                return False
+        Args:
+            data: Command to send, bytes or str (str is newline-terminated
+                and encoded here)
+            
+        Returns:
+            bool: True once the command is queued
+        """
+        if isinstance(data, str):
+            data = (data + "\n").encode('ascii')
+        print("--->", data.decode('ascii'), end='')
         
         try:
-            with self.lock:
-                if self.connected and self.ser:
-                    self.ser.write((data + "\n").encode())
-                    time.sleep(0.1)
-                    return True
-        except (serial.SerialException, OSError) as e:
-            print(f"Error sending data: {e}")
-            self._disconnect()
-            return False
-        except Exception as e:
-            print(f"Unexpected error during send: {e}")
-            self._disconnect()
-            return False
-        
-        return False
+            self._q.put_nowait(data)
+        except queue.Full:
+            # Evict the unsent stale command in favour of this one
+            try:
+                self._q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._q.put_nowait(data)
+            except queue.Full:
+                pass
+        return True
+    
+    def _writer(self):
+        """Drain the command queue; connection handling lives here so
+        connect retries and write errors never stall the tracking loop."""
+        while True:
+            data = self._q.get()
+            
+            if not self.connected:
+                if not self.connect():
+                    print("Not connected to ESP32, dropping command.")
+                    continue
+            
+            try:
+                with self.lock:
+                    if self.connected and self.ser:
+                        self.ser.write(data)
+            except (serial.SerialException, OSError) as e:
+                print(f"Error sending data: {e}")
+                self._disconnect()
+            except Exception as e:
+                print(f"Unexpected error during send: {e}")
+                self._disconnect()
     
     def _disconnect(self):
         """Internal method to disconnect."""
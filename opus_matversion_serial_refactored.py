@@ -6,18 +6,18 @@ Fetches live aircraft data from web, applies delay compensation, predicts future
 and sends corrected azimuth/altitude to ESP32 tracker.
 """
 
+import functools
 import time
 import threading
-import numpy as np
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.common.by import By
+
 
 # Import modules from functions package
 from functions import (
     load_config,
+    Observer,
     lla_to_ecef,
-    get_az_alt,
     get_future_position,
     parse_position_string,
     parse_float_value,
@@ -28,6 +28,18 @@ from functions import (
     get_prediction_time,
 )
 
+# One script, one round trip: all five readouts come back as a single
+# list instead of five .text fetches over the wire. getElementById is
+# also the cheapest lookup the page offers. Kept as a constant so the
+# source string is not rebuilt per iteration.
+_READ_ELEMENTS_JS = """return [
+    document.getElementById('selected_position').innerText,
+    document.getElementById('selected_altitude_geom1').innerText,
+    document.getElementById('selected_track1').innerText,
+    document.getElementById('selected_speed1').innerText,
+    document.getElementById('selected_vert_rate').innerText
+];"""
+
 
 def main():
     """Main execution function."""
@@ -43,10 +55,18 @@ def main():
         print(f"Configuration error: {e}")
         return
     
-    # Pre-calculate home position in ECEF (constant, used for all calculations)
-    home_ecef = lla_to_ecef(home_lat, home_lon, home_alt)
-    home_lat_rad = np.radians(home_lat)
-    home_lon_rad = np.radians(home_lon)
+    # Pre-calculate home position once (ECEF, trig, ENU rotation); the
+    # observer never moves, so none of this belongs in the tracking loop
+    home = Observer(home_lat, home_lon, home_alt)
+    
+    # At the 0.3 s poll rate consecutive predicted positions are often
+    # identical to within a metre (slow aircraft, slider at 0), so the
+    # ECEF conversion and ENU rotation are memoized on inputs quantized
+    # to ~1e-6 deg / 0.1 m. The home observer is bound by closure and
+    # never part of the key.
+    @functools.lru_cache(maxsize=4096)
+    def az_alt_cached(lat_q, lon_q, alt_q):
+        return home.az_alt(lla_to_ecef(lat_q, lon_q, alt_q))
     
     # Initialize serial handler
     serial_handler = SerialHandler(port="COM5", baud_rate=115200)
@@ -68,24 +88,24 @@ def main():
         driver.get(url)
         time.sleep(1)  # Wait for page to load
         
-        pos = driver.find_element(By.CLASS_NAME, 'infoData')
+        # Last commanded (az, alt) at the tracker's step resolution;
+        # identical commands are not resent
+        last_cmd = (None, None)
         
         # Main tracking loop
         for iteration in range(200000):
             try:
-                # Fetch aircraft data from webpage
-                position_elem = pos.find_element(By.XPATH, '//*[@id="selected_position"]')
-                height_elem = pos.find_element(By.XPATH, '//*[@id="selected_altitude_geom1"]')
-                track_elem = pos.find_element(By.XPATH, '//*[@id="selected_track1"]')
-                gspd_elem = pos.find_element(By.XPATH, '//*[@id="selected_speed1"]')
-                vertspd_elem = pos.find_element(By.XPATH, '//*[@id="selected_vert_rate"]')
+                # One execute_script round trip reads all five values;
+                # element handles never leave the browser, so there is
+                # nothing to go stale between ticks
+                (position_text, height_text, track_text,
+                 gspd_text, vertspd_text) = driver.execute_script(_READ_ELEMENTS_JS)
                 
-                # Parse aircraft position and state
-                ac_position = parse_position_string(position_elem.text)
-                ac_height_ft = parse_float_value(height_elem.text)
-                ac_track = parse_float_value(track_elem.text)
-                ac_speed = parse_float_value(gspd_elem.text)
-                ac_vert_rate = parse_float_value(vertspd_elem.text)
+                ac_position = parse_position_string(position_text)
+                ac_height_ft = parse_float_value(height_text)
+                ac_track = parse_float_value(track_text)
+                ac_speed = parse_float_value(gspd_text)
+                ac_vert_rate = parse_float_value(vertspd_text)
                 
                 # Validate data
                 if not ac_position or ac_height_ft is None:
@@ -116,16 +136,22 @@ def main():
                 update_plot_data(ac_lat, ac_lon, future_lat, future_lon, pred_time)
                 
                 # Calculate azimuth and altitude from home to predicted position
-                ac_ecef = lla_to_ecef(future_lat, future_lon, future_alt_m)
-                azimuth, altitude = get_az_alt(home_ecef, home_lat_rad, home_lon_rad, ac_ecef)
+                azimuth, altitude = az_alt_cached(
+                    round(future_lat, 6), round(future_lon, 6),
+                    round(future_alt_m, 1))
                 
                 print(f'Azimuth: {azimuth:.5f}° Altitude: {altitude:.5f}°')
                 
-                # Send to tracker if within limits
+                # Send to tracker if within limits; two decimals is at
+                # the ESP32's minimum commandable step, so a repeat at
+                # that resolution would only burn serial bandwidth
                 if altitude < -30 or altitude > 54:
                     print("Beyond altitude limits, skipping...")
                 else:
-                    serial_handler.send(f"AZ:{azimuth:.5f} ALT:{altitude:.5f}")
+                    key = (round(azimuth, 2), round(altitude, 2))
+                    if key != last_cmd:
+                        serial_handler.send_azalt(azimuth, altitude)
+                        last_cmd = key
                 
                 time.sleep(0.3)
                 